@@ -49,6 +49,33 @@ ZIPCODE_THRESHOLD = 0.80
 INFER_PROFILER_ROWS = 200
 
 
+def n_largest_values(series, n, include_uniques):
+    """
+    Count the values of a series, including nulls, and keep the n most frequent ones.
+    :param series: Series to be processed.
+    :param n: numbers of values to be returned. If None, all the values are returned.
+    :param include_uniques: If True, returns a tuple with the value counts and the number of unique values.
+    :return:
+    """
+    return n_largest_counts(series.value_counts(dropna=False), n, include_uniques)
+
+
+def n_largest_counts(value_counts, n, include_uniques):
+    """
+    Keep the n most frequent values of a value count.
+    :param value_counts: Series with the count of every value.
+    :param n: numbers of values to be returned. If None, all the values are returned.
+    :param include_uniques: If True, returns a tuple with the value counts and the number of unique values.
+    :return:
+    """
+    _n_largest = value_counts.nlargest(n) if n is not None else value_counts
+
+    if include_uniques:
+        return _n_largest, value_counts.count()
+
+    return _n_largest
+
+
 class BaseColumns(ABC):
     """Base class for all Cols implementations"""
 
@@ -446,7 +473,8 @@ class BaseColumns(ABC):
         :param where: When the condition in 'where' is True, replace with 'value_func'. Where False, replace with 'default' or keep the original value.
         :param args: Argument when 'value_func' param is a function.
         :param default: Entries where 'where' is False are replaced with corresponding value from other.
-        :param eval_value: Parse 'value_func' param in case a string is passed.
+        :param eval_value: Parse 'value_func' param in case a string is passed. Strings that refer to column names,
+        like "price * quantity", are evaluated over the dataframe columns.
         :param mode: If possible, apply the function using one argument for each column, if not, applies every argument to every element.
         :return:
         """
@@ -517,7 +545,12 @@ class BaseColumns(ABC):
                 else:
                     default = self.F._new_series(default, index=dfd.index)
             if _eval_value and is_str(_value):
-                _value = eval(_value)
+                try:
+                    _value = eval(_value)
+                except NameError:
+                    # Expressions over column names, like "price * quantity", are evaluated by the dataframe
+                    # itself, which uses numexpr when it is installed
+                    _value = dfd.eval(_value)
 
             if is_str(where):
                 if where in df.cols.names():
@@ -638,15 +671,22 @@ class BaseColumns(ABC):
         cols = parse_columns(df, cols)
         result = df.cols.data_type(cols, names=True, tidy=False)["data_type"] if use_internal else {}
 
+        data_types = {}
         for col_name in cols:
             data_type = Meta.get(df.meta, f"columns_data_types.{col_name}.data_type")
 
             if data_type is None:
                 data_type = Meta.get(df.meta, f"profile.columns.{col_name}.stats.inferred_data_type.data_type")
 
-            if calculate and data_type is None:
-                data_type = df.cols.infer_type(col_name)['data_type']
+            data_types[col_name] = data_type
+
+        # The columns without a data type are inferred together, sampling the dataframe once
+        missing_cols = [col_name for col_name, data_type in data_types.items() if data_type is None]
+        if calculate and len(missing_cols):
+            inferred = df.cols.infer_type(missing_cols, tidy=False)["infer_type"]
+            data_types.update({col_name: inferred[col_name]["data_type"] for col_name in missing_cols})
 
+        for col_name, data_type in data_types.items():
             if data_type is None:
                 data_type = result.get(col_name, None)
 
@@ -2395,16 +2435,18 @@ class BaseColumns(ABC):
 
         return df
 
-    def word_tokenize(self, cols="*", output_cols=None) -> 'DataFrameType':
+    def word_tokenize(self, cols="*", output_cols=None, engine="nltk") -> 'DataFrameType':
         """
 
         :param cols: "*", column name or list of column names to be processed.
         :param output_cols: Column name or list of column names where the transformed data will be saved.
+        :param engine: "nltk" to tokenize using nltk or "regex" to only split word characters, which is faster
+        but drops punctuation.
         :return:
         """
 
-        return self.apply(cols, self.F.word_tokenize, func_return_type=object, output_cols=output_cols,
-                          meta_action=Actions.WORD_TOKENIZE.value, mode="vectorized")
+        return self.apply(cols, self.F.word_tokenize, args=(engine,), func_return_type=object,
+                          output_cols=output_cols, meta_action=Actions.WORD_TOKENIZE.value, mode="vectorized")
 
     def word_count(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2568,7 +2610,7 @@ class BaseColumns(ABC):
         format = transform_date_format(format) if transform_format and format else format
 
         return self.apply(cols, self.F.to_datetime, func_return_type=str,
-                          output_cols=output_cols, args=format, mode="partitioned")
+                          output_cols=output_cols, args=(format,), mode="partitioned")
 
     def _date_format(self, cols="*", format=None, output_cols=None, func=None, meta_action=None) -> 'DataFrameType':
         """
@@ -3088,15 +3130,41 @@ class BaseColumns(ABC):
         strategy, fill_value = prepare_columns_arguments(cols, strategy, fill_value)
         output_cols = get_output_cols(cols, output_cols)
 
-        for col_name, output_col, _strategy, _fill_vale in zip(cols, output_cols, strategy, fill_value):
+        dfd = df.data
+        series = {}
+        statistics = {}
 
+        for col_name, _strategy in zip(cols, strategy):
+            # The cast to float is done once for both the statistic and the imputation
             if _strategy != "most_frequent" and (_strategy != "constant" or data_type == "numeric"):
-                df = df.cols.to_float(col_name)
+                series[col_name] = self.F.to_float(dfd[col_name])
+            else:
+                series[col_name] = dfd[col_name]
 
-            df = df.cols.apply(col_name, self.F.impute, output_cols=output_col, args=(_strategy, _fill_vale),
-                               meta_action=Actions.IMPUTE.value, mode="vectorized")
+            if _strategy != "constant":
+                statistics[col_name] = self.F.impute_statistic(series[col_name], _strategy)
 
-        return df
+        # The statistics of every column are computed at once
+        if statistics:
+            values = val_to_list(self.F.compute(*statistics.values()), convert_tuple=True)
+            statistics = dict(zip(statistics.keys(), values))
+
+        kw_columns = {}
+        output_ordered_columns = df.cols.names()
+
+        for col_name, output_col, _strategy, _fill_value in zip(cols, output_cols, strategy, fill_value):
+            kw_columns[output_col] = self.F.impute(series[col_name], _strategy, _fill_value,
+                                                   statistics.get(col_name))
+
+            # Preserve column order
+            if output_col not in output_ordered_columns:
+                col_index = output_ordered_columns.index(col_name) + 1
+                output_ordered_columns[col_index:col_index] = [output_col]
+
+        df = df.cols.assign(kw_columns)
+        df.meta = Meta.action(df.meta, Actions.IMPUTE.value, list(kw_columns.keys()))
+
+        return df.cols.select(output_ordered_columns)
 
     def fill_na(self, cols="*", value=None, output_cols=None, eval_value: bool = False) -> 'DataFrameType':
         """
@@ -3169,8 +3237,9 @@ class BaseColumns(ABC):
         """
 
         df = self.root
-        if df.op.engine != Engine.SPARK.value and estimate is not False:
-            logger.warn(f"'estimate' argument is only supported on {EnginePretty.SPARK.value}")
+        if df.op.engine not in [Engine.SPARK.value, Engine.DASK.value] and estimate is not False:
+            logger.warn(f"'estimate' argument is only supported on {EnginePretty.SPARK.value} and "
+                        f"{EnginePretty.DASK.value}")
         return df.cols.agg_exprs(cols, self.F.count_uniques, estimate, tidy=tidy, compute=compute)
 
     def _math(self, cols="*", value=None, operator=None, output_cols=None, output_col=None, name="",
@@ -3605,6 +3674,7 @@ class BaseColumns(ABC):
             cols_types = self.root.cols.inferred_data_type(cols, calculate=True, tidy=False)["inferred_data_type"]
 
         result = {}
+        pending = {}
 
         quality_props = ["match", "missing", "mismatch"]
 
@@ -3624,31 +3694,33 @@ class BaseColumns(ABC):
 
             dtype = df.constants.INTERNAL_TO_OPTIMUS.get(dtype, dtype)
 
+            # Sums over the boolean masks instead of a frequency of the match mask
             if dtype == ProfilerDataTypes.UNKNOWN.value:
-                missing = df.mask.null(col_name).cols.sum()
-                missing = 0 if missing is None else int(missing)
-
-                matches = 0
-                mismatches =  self.root.rows.count()- missing
+                mask_null = df.mask.null(col_name).data[col_name]
+                pending[col_name] = (0, mask_null.sum(), (~mask_null).sum())
             else:
-                matches_mismatches = getattr(df[col_name].mask, dtype)(col_name).cols.frequency()
+                mask_match = getattr(df[col_name].mask, dtype)(col_name).data[col_name]
                 if dtype == ProfilerDataTypes.NULL.value:
-                    missing = 0
+                    pending[col_name] = (mask_match.sum(), 0, (~mask_match).sum())
                 else:
-                    missing = df.mask.null(col_name).cols.sum()
-                values = {list(j.values())[0]: list(j.values())[1] for j in
-                          matches_mismatches["frequency"][col_name]["values"]}
-                matches = values.get(True)
-                mismatches = values.get(False, missing) - missing
+                    # Nulls can also be matched by the data type mask, so they are excluded from the mismatches
+                    mask_null = df.mask.null(col_name).data[col_name]
+                    pending[col_name] = (mask_match.sum(), mask_null.sum(), (~mask_match & ~mask_null).sum())
+
+        # The counts of every column are computed in a single pass
+        pending = self.F.compute(pending)
 
-                # Ensure that value are not None
-                matches = 0 if matches is None else int(matches)
-                mismatches = 0 if mismatches is None else int(mismatches)
-                missing = 0 if missing is None else int(missing)
+        for col_name, (matches, missing, mismatches) in pending.items():
+            # Ensure that value are not None
+            matches = 0 if matches is None else int(matches)
+            mismatches = 0 if mismatches is None else int(mismatches)
+            missing = 0 if missing is None else int(missing)
 
             result[col_name] = {"match": matches,
                                 "missing": missing, "mismatch": mismatches}
 
+        result = {col_name: result[col_name] for col_name in cols_types.keys()}
+
         for col_name in cols_types.keys():
             result[col_name].update({"inferred_data_type": cols_types[col_name]})
 
@@ -3775,6 +3847,17 @@ class BaseColumns(ABC):
 
         return format_dict(result, tidy)
 
+    def _n_largest(self, series, n, include_uniques):
+        """
+        Return a delayed value count of the n most frequent values in a series.
+
+        :param series: Series to be processed.
+        :param n: numbers of values to be returned. If None, all the values are returned.
+        :param include_uniques: If True, returns a tuple with the value counts and the number of unique values.
+        :return:
+        """
+        return self.F.delayed(n_largest_values)(series, n, include_uniques)
+
     def frequency(self, cols="*", n=MAX_BUCKETS, percentage=False, total_rows=None, count_uniques=False,
                   compute=True, tidy=False) -> dict:
         """
@@ -3809,20 +3892,6 @@ class BaseColumns(ABC):
         # avoid passing "self" to a Dask worker
         to_items = self.F.to_items
 
-        @self.F.delayed
-        def calculate_n_largest(_series, include_uniques):
-            _value_counts = _series.value_counts(dropna=False)
-            if n is not None:
-                _n_largest = _value_counts.nlargest(n)
-            else:
-                _n_largest = _value_counts
-
-            if include_uniques:
-                _count_uniques = _value_counts.count()
-                return _n_largest, _count_uniques
-
-            return _n_largest
-
         def kc(x):
             f = x[0] if is_numeric(x[0]) else float("inf")
             return -x[1], f, str(x[0])
@@ -3858,7 +3927,7 @@ class BaseColumns(ABC):
 
             return _value_counts
 
-        n_largest = [calculate_n_largest(df.data[col], count_uniques) for col in cols]
+        n_largest = [self._n_largest(df.data[col], n, count_uniques) for col in cols]
 
         b = [series_to_dict(_n_largest, _cols) for _n_largest, _cols in zip(n_largest, cols)]
 
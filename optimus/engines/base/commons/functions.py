@@ -1,22 +1,50 @@
 import re
+from functools import lru_cache
 
 import numpy as np
+import pandas as pd
 
 # From a top point of view we organize Optimus separating the functions in dataframes and dask engines.
 # Some functions are commons to pandas and dask.
 from optimus.helpers.columns import parse_columns
 from optimus.helpers.constants import Actions
 from optimus.helpers.core import val_to_list
+from optimus.helpers.raiseit import RaiseIt
 from optimus.infer import is_str
 
 
-def word_tokenize(series):
-    import nltk
-    return nltk.word_tokenize(series)
+_WORD_REGEX = re.compile(r"\w+")
+
+
+def word_tokenize(series, engine="nltk"):
+    """
+    Split the values of a series in words
+    :param series: Series of strings
+    :param engine: "nltk" to use nltk.word_tokenize on every value or "regex" to find the word characters using
+    the engine string functions, which is much faster but does not return punctuation tokens
+    :return:
+    """
+    if engine == "regex":
+        return series.str.findall(_WORD_REGEX)
+    elif engine == "nltk":
+        import nltk
+        return series.map(nltk.word_tokenize, na_action=None)
+    else:
+        RaiseIt.value_error(engine, ["nltk", "regex"])
 
 
 def hist(series, bins, range):
-    return np.histogram(series.to_float(), bins=bins, range=range)
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        values = series.values
+    else:
+        values = series.to_float().values
+
+    # Device arrays are processed without copying them to host memory
+    if hasattr(values, "__cuda_array_interface__"):
+        import cupy
+        return cupy.histogram(values, bins=bins, range=range)
+
+    return np.histogram(values, bins=bins, range=range)
 
 
 def string_to_index(df, cols, output_cols=None, le=None, **kwargs):
@@ -31,6 +59,18 @@ def string_to_index(df, cols, output_cols=None, le=None, **kwargs):
     """
 
     def _string_to_index(value):
+        # Categorical columns already hold the codes, they are remapped to the sorted labels so the result and
+        # le.classes_ match the label encoder. Missing values and labels repeated after the cast are left to it
+        if isinstance(value, pd.Series) and isinstance(value.dtype, pd.CategoricalDtype) and not value.hasnans:
+            value = value.cat.remove_unused_categories()
+            categories = np.asarray(value.cat.categories.astype(str))
+            if len(np.unique(categories)) == len(categories):
+                order = np.argsort(categories)
+                ranks = np.empty(len(categories), dtype=np.int64)
+                ranks[order] = np.arange(len(categories))
+                le.classes_ = categories[order]
+                return ranks[value.cat.codes.to_numpy()]
+
         # Label encoder can not handle np.nan
         # value[value.isnull()] = 'NaN'
         return le.fit_transform(value.astype(str))
@@ -60,6 +100,261 @@ def index_to_string(df, cols, output_cols=None, le=None, **kwargs):
                          mode="vectorized")
 
 
+@lru_cache(maxsize=256)
+def _find_regex(sub, ignore_case):
+    """
+    Compile the alternation of escaped substrings used by find. Cached so repeated calls with the same
+    substrings reuse the compiled pattern.
+    :param sub: Tuple of substrings to search for
+    :param ignore_case:
+    :return:
+    """
+    return re.compile('|'.join([re.escape(s) for s in sub]), re.IGNORECASE if ignore_case else 0)
+
+
+@lru_cache(maxsize=256)
+def _make_finder(sub, ignore_case):
+    """
+    Generate a function specialized for a few literal substrings that finds their leftmost-first, non
+    overlapping matches with str.find, giving the same result as the regex alternation without its overhead.
+    Cached so repeated calls with the same substrings reuse the generated function.
+    :param sub: Tuple of substrings to search for
+    :param ignore_case: Values are lower cased, so only ascii values must be passed
+    :return:
+    """
+    lines = ["def finder(v):"]
+    if ignore_case:
+        lines.append("    v = v.lower()")
+        sub = tuple(s.lower() for s in sub)
+    lines.append("    r = []")
+    lines.append("    i = 0")
+    lines.extend("    j%d = v.find(%r)" % (k, s) for k, s in enumerate(sub))
+    lines.append("    while True:")
+    # A literal is only searched again once the previous match has moved past its last position
+    lines.extend("        if 0 <= j%d < i:\n            j%d = v.find(%r, i)" % (k, k, s) for k, s in enumerate(sub))
+    lines.append("        j = -1")
+    for k, s in enumerate(sub):
+        # Ties go to the first substring, like the regex alternation
+        condition = "j%d >= 0" % k if k == 0 else "j%d >= 0 and (j < 0 or j%d < j)" % (k, k)
+        lines.append("        if %s:\n            j = j%d\n            n = %d" % (condition, k, len(s)))
+    lines.append("        if j < 0:\n            break")
+    lines.append("        r.append([j, j + n])")
+    lines.append("        i = j + n")
+    lines.append("    return r or None")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<find %r>" % (sub,), "exec"), namespace)
+    return namespace["finder"]
+
+
+@lru_cache(maxsize=256)
+def _find_hyperscan_database(sub, ignore_case):
+    """
+    Compile the substrings used by find into a Hyperscan database, which scans every pattern in a single
+    pass. Returns None if hyperscan is not installed.
+    :param sub: Tuple of substrings to search for
+    :param ignore_case:
+    :return:
+    """
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    if ignore_case:
+        flags |= hyperscan.HS_FLAG_CASELESS
+
+    database = hyperscan.Database()
+    database.compile(expressions=[re.escape(s).encode() for s in sub], ids=list(range(len(sub))),
+                     elements=len(sub), flags=[flags] * len(sub))
+    return database
+
+
+@lru_cache(maxsize=256)
+def _find_automaton(sub, ignore_case):
+    """
+    Build an Aho-Corasick automaton with the substrings used by find. Returns None if pyahocorasick is not
+    installed.
+    :param sub: Tuple of substrings to search for
+    :param ignore_case: Substrings are lower cased, the values must be lower cased too
+    :return:
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for i, s in enumerate(sub):
+        key = s.lower() if ignore_case else s
+        # Keep the priority of the first repeated substring like the regex alternation does
+        if not automaton.exists(key):
+            automaton.add_word(key, (i, len(s)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _on_hyperscan_match(_id, start, end, flags, context):
+    context.append((start, end, _id))
+
+
+def _leftmost_first(matches):
+    """
+    Reduce the (start, end, priority) matches reported by a multi-pattern scanner to the non overlapping
+    leftmost-first matches that a regex alternation returns.
+    :param matches:
+    :return:
+    """
+    result = []
+    position = 0
+    for start, end, _ in sorted(matches, key=lambda m: (m[0], m[2])):
+        if start >= position:
+            result.append([start, end])
+            position = end
+    return result
+
+
+def _find_literal_kernel(data, offsets, needle, needle_length):
+    """
+    Search a literal in every row of a UTF-8 Arrow string buffer. Returns the character start of every
+    match and the number of matches per row.
+    """
+    n = len(offsets) - 1
+    m = len(needle)
+    counts = np.zeros(n, dtype=np.int64)
+    starts = np.empty(len(data) // m + 1, dtype=np.int64)
+    k = 0
+    for row in range(n):
+        i = offsets[row]
+        end = offsets[row + 1]
+        char = 0
+        while i + m <= end:
+            j = 0
+            while j < m and data[i + j] == needle[j]:
+                j += 1
+            if j == m:
+                starts[k] = char
+                k += 1
+                counts[row] += 1
+                i += m
+                char += needle_length
+            else:
+                # Only count the first byte of every UTF-8 character
+                if data[i] & 0xC0 != 0x80:
+                    char += 1
+                i += 1
+    return starts[:k], counts
+
+
+@lru_cache(maxsize=1)
+def _find_literal_jit():
+    """
+    Compile _find_literal_kernel with numba. Returns None if numba is not installed.
+    :return:
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_find_literal_kernel)
+
+
+def _find_literal_positions(kernel, values, mask, sub):
+    """
+    Get the match positions of a literal in an array of values using the compiled kernel
+    :param kernel: Compiled _find_literal_kernel
+    :param values: Numpy object array
+    :param mask: Boolean array with the values that are strings
+    :param sub: Literal to search for
+    :return:
+    """
+    import pyarrow as pa
+
+    array = pa.array(np.where(mask, values, None), type=pa.large_string(), from_pandas=True)
+    _, offsets, data = array.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64, count=len(array) + 1)
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, dtype=np.uint8)
+
+    starts, counts = kernel(data, offsets, np.frombuffer(sub.encode(), dtype=np.uint8), len(sub))
+
+    result = np.empty(len(values), dtype="object")
+    position = 0
+    for i, count in enumerate(counts):
+        if count:
+            result[i] = [[int(start), int(start) + len(sub)] for start in starts[position:position + count]]
+            position += count
+    return result
+
+
+def _match_position_columns(positions, index=None):
+    """
+    Split the match positions of a column into a starts and an ends column. Every row holds an int32 list and
+    all the rows of a column share the same flat buffer. Arrow backed columns are used when pandas supports them.
+    :param positions: Numpy object array of [[start, end], ...] lists or None
+    :param index: Index of the output series
+    :return:
+    """
+    valid = np.fromiter((p is not None for p in positions), dtype=bool, count=len(positions))
+    lengths = np.fromiter((len(p) if p is not None else 0 for p in positions), dtype=np.int32,
+                          count=len(positions))
+    offsets = np.zeros(len(positions) + 1, dtype=np.int32)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.fromiter((i for p in positions[valid] for match in p for i in match), dtype=np.int32,
+                       count=int(offsets[-1]) * 2).reshape(-1, 2)
+
+    try:
+        import pyarrow as pa
+        arrow_dtype = pd.ArrowDtype
+    except (ImportError, AttributeError):
+        columns = []
+        for values in (flat[:, 0], flat[:, 1]):
+            column = np.full(len(positions), None, dtype="object")
+            for i in np.flatnonzero(valid):
+                column[i] = values[offsets[i]:offsets[i + 1]]
+            columns.append(pd.Series(column, index=index, dtype="object"))
+        return tuple(columns)
+
+    # Null offsets mark the rows without any match
+    offsets = pa.array(offsets, mask=np.append(~valid, False))
+    return tuple(pd.Series(pd.arrays.ArrowExtensionArray(pa.ListArray.from_arrays(offsets, pa.array(values))),
+                           index=index, dtype=arrow_dtype(pa.list_(pa.int32())))
+                 for values in (flat[:, 0], flat[:, 1]))
+
+
+def _str_mask(values):
+    """
+    Get a boolean mask of the values that are strings, inferring the type of the whole array once and only
+    checking every value when the types are mixed
+    :param values: Numpy object array
+    :return:
+    """
+    inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+    if inferred_type == "string":
+        return pd.notna(values)
+    elif inferred_type.startswith("mixed"):
+        return np.fromiter((is_str(v) for v in values), dtype=bool, count=len(values))
+    return np.zeros(len(values), dtype=bool)
+
+
+def _contains_any(values, sub):
+    """
+    Get a boolean mask of the strings that contain any of the substrings using Arrow string kernels
+    :param values: Numpy object array of strings
+    :param sub: List of substrings
+    :return:
+    """
+    try:
+        strings = pd.Series(values, dtype="string[pyarrow]")
+    except ImportError:
+        return np.ones(len(values), dtype=bool)
+
+    mask = np.zeros(len(values), dtype=bool)
+    for s in sub:
+        mask |= strings.str.contains(s, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
 def find(df, columns, sub, ignore_case=False):
     """
     Find the start and end position for a char or substring
@@ -73,26 +368,76 @@ def find(df, columns, sub, ignore_case=False):
     columns = parse_columns(df, columns)
     sub = val_to_list(sub)
 
-    def get_match_positions(_value, _separator):
-        result = None
-        if is_str(_value):
-            regex_str = '|'.join([re.escape(s) for s in _separator])
-            if ignore_case:
-                regex_str = f"(?i)({regex_str})"
-            regex = re.compile(regex_str)
+    # Compile the pattern once for every row and column instead of once per row
+    regex = _find_regex(tuple(sub), bool(ignore_case))
 
-            length = [[match.start(), match.end()] for match in
-                      regex.finditer(_value)]
-            result = length if len(length) > 0 else None
-        return result
+    # A few literals are searched with a generated str.find function. Hyperscan reports byte offsets, so it is
+    # only used for ascii substrings and values. Lower casing is only equivalent to re.IGNORECASE for ascii, so
+    # the generated function and the Aho-Corasick automaton are restricted the same way
+    finder = None
+    database = None
+    automaton = None
+    literals = len(sub) > 0 and all(is_str(s) and s for s in sub)
+    ascii_sub = literals and all(s.isascii() for s in sub)
+    if literals and len(sub) <= 3 and (ascii_sub or not ignore_case):
+        finder = _make_finder(tuple(sub), bool(ignore_case))
+    elif literals and len(sub) >= 3:
+        if ascii_sub:
+            database = _find_hyperscan_database(tuple(sub), bool(ignore_case))
+        if database is None and (ascii_sub or not ignore_case):
+            automaton = _find_automaton(tuple(sub), bool(ignore_case))
+
+    # Only called on string values
+    def get_match_positions(_value):
+        if finder is not None and (not ignore_case or _value.isascii()):
+            return finder(_value)
+        elif database is not None and _value.isascii():
+            matches = []
+            database.scan(_value.encode(), match_event_handler=_on_hyperscan_match, context=matches)
+            length = _leftmost_first(matches)
+        elif automaton is not None and (not ignore_case or _value.isascii()):
+            matches = [(end - size + 1, end + 1, i) for end, (i, size) in
+                       automaton.iter(_value.lower() if ignore_case else _value)]
+            length = _leftmost_first(matches)
+        else:
+            length = [[match.start(), match.end()] for match in regex.finditer(_value)]
+        return length if len(length) > 0 else None
+
+    # Dispatch over the underlying numpy array to skip the pandas apply machinery
+    _get_match_positions = np.frompyfunc(get_match_positions, 1, 1)
+
+    # A single literal is searched with a compiled kernel when numba is available
+    kernel = None
+    if len(sub) == 1 and not ignore_case and is_str(sub[0]) and sub[0]:
+        kernel = _find_literal_jit()
 
     dfd = df.data
 
-    for col_name in columns:
-        # Categorical columns can not handle a list inside a list as return for example [[1,2],[6,7]].
-        # That could happened if we try to split a categorical column
-        # dfd[col_name] = dfd[col_name].astype("object")
-        dfd[col_name + "__match_positions__"] = dfd[col_name].astype("object").apply(get_match_positions,
-                                                                                     args=(sub,))
+    # Categorical columns can not handle a list inside a list as return for example [[1,2],[6,7]].
+    # That could happened if we try to split a categorical column
+    values = [dfd[col_name].to_numpy(dtype="object") for col_name in columns]
+    masks = [_str_mask(_values) for _values in values]
+
+    # The strings of every column are matched in a single pass
+    strings = np.concatenate([_values[mask] for _values, mask in zip(values, masks)] or [[]])
+    if kernel is not None:
+        matches = _find_literal_positions(kernel, strings, np.ones(len(strings), dtype=bool), sub[0])
+    elif len(strings):
+        matches = np.full(len(strings), None, dtype="object")
+        # Arrow discards the strings without any match before running the regex on them
+        candidates = np.ones(len(strings), dtype=bool) if ignore_case else _contains_any(strings, sub)
+        if candidates.any():
+            matches[candidates] = _get_match_positions(strings[candidates])
+    else:
+        matches = strings
+
+    position = 0
+    for col_name, _values, mask in zip(columns, values, masks):
+        positions = np.full(len(_values), None, dtype="object")
+        count = int(mask.sum())
+        positions[mask] = matches[position:position + count]
+        position += count
+        dfd[col_name + "__match_starts__"], dfd[col_name + "__match_ends__"] = \
+            _match_position_columns(positions, dfd.index)
 
     return df.new(dfd)
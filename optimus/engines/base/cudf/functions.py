@@ -5,20 +5,23 @@ import cudf
 
 from optimus.engines.base.functions import BaseFunctions
 from optimus.helpers.core import val_to_list
+from optimus.infer import is_list
+
+ISO_DATETIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"]
+DATETIME_FORMAT_SAMPLE_SIZE = 100
 
 
 class CUDFBaseFunctions(BaseFunctions, ABC):
     @staticmethod
     def to_dict(series) -> dict:
-        series.name = str(series.name)
-        return series.to_pandas().to_dict()
+        # Arrow avoids building an intermediate pandas Series on the host
+        return dict(zip(series.index.to_arrow().to_pylist(), series.to_arrow().to_pylist()))
 
     def to_items(self, series) -> dict:
         """
         Convert series to a list of tuples [(index, value), ...]
         """
-        df = series.reset_index()
-        return df.to_pandas().to_dict(orient='split')['data']
+        return list(zip(series.index.to_arrow().to_pylist(), series.to_arrow().to_pylist()))
 
     def is_integer(self, series):
         if str(series.dtype) in self.constants.DATETIME_INTERNAL_TYPES:
@@ -43,6 +46,9 @@ class CUDFBaseFunctions(BaseFunctions, ABC):
         return cudf.Series([False] * len(series))
 
     def _to_integer(self, series, default=0):
+        # Coercing is only needed for non integer columns
+        if cudf.api.types.is_integer_dtype(series.dtype):
+            return series
         return cudf.to_numeric(series, errors="coerce", downcast="integer")
 
     def _to_float(self, series):
@@ -50,6 +56,16 @@ class CUDFBaseFunctions(BaseFunctions, ABC):
         # Workaround to https://github.com/rapidsai/cudf/issues/10049
         if series.dtype.type == np.bool_:
             return series.astype(float)
+        elif cudf.api.types.is_numeric_dtype(series.dtype):
+            if series.dtype == np.float32 or series.dtype.itemsize <= 2:
+                return series.astype("float32")
+            # float32 is only used when every value fits in it, floats must stay within its range and integers
+            # within its 24 bits mantissa. Otherwise the column is kept in float64
+            limit = np.finfo(np.float32).max if cudf.api.types.is_float_dtype(series.dtype) else 2 ** 24
+            max_abs = series.abs().max()
+            if max_abs is None or not max_abs > limit:
+                return series.astype("float32")
+            return series.astype("float64")
         else:
             return cudf.to_numeric(series, errors="coerce", downcast="float")
 
@@ -58,15 +74,48 @@ class CUDFBaseFunctions(BaseFunctions, ABC):
         return series.astype(str)
 
     def _to_datetime(self, value, format):
+        if format is None and cudf.api.types.is_string_dtype(value.dtype):
+            # ISO-8601 values are parsed with a fixed format, skipping the format inference on the host. The format
+            # is detected on the first values only, instead of checking the whole column for every candidate
+            sample = value.head(DATETIME_FORMAT_SAMPLE_SIZE).dropna()
+            if len(sample):
+                for iso_format in ISO_DATETIME_FORMATS:
+                    if sample.str.istimestamp(iso_format).all():
+                        format = iso_format
+                        break
         return cudf.to_datetime(value, format=format, errors="coerce")
 
     def replace_chars(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
-        if ignore_case:
-            str_regex = [r'(?i)%s' % re.escape(s) for s in search]
+        prefix = r'(?i)' if ignore_case else ''
+        if is_list(replace_by):
+            str_regex = [prefix + re.escape(s) for s in search]
         else:
-            str_regex = [r'%s' % re.escape(s) for s in search]
-        return self.to_string(series).str.replace(str_regex, replace_by, regex=True)
+            # A single alternation is matched in one pass instead of one kernel per pattern
+            str_regex = prefix + r'(?:%s)' % '|'.join([re.escape(s) for s in search])
+        # cuDF stores strings as object columns, casting them again would copy the whole column
+        if str(series.dtype) not in ["object", *self.constants.STRING_INTERNAL_TYPES]:
+            series = self.to_string(series)
+        return series.str.replace(str_regex, replace_by, regex=True)
+
+    @staticmethod
+    def string_to_index(series, le):
+        """
+        Encode a series as label indices on the device. cuDF categories are sorted, so the codes are the same
+        a label encoder would assign.
+        """
+        series = series.astype(str).astype("category")
+        le.classes_ = series.cat.categories
+        return series.cat.codes
+
+    @staticmethod
+    def index_to_string(series, le):
+        """
+        Decode label indices using the categories saved by string_to_index
+        """
+        if isinstance(le.classes_, cudf.Index):
+            return cudf.Series(le.classes_.take(series.astype("int32").values), index=series.index)
+        return le.inverse_transform(series.astype("int"))
 
     def contains(self, series, value, case, flags, na, regex):
         return self.to_string_accessor(series).contains(value, case=case, flags=flags, regex=regex).fillna(na)
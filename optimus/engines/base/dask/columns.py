@@ -2,6 +2,7 @@ import dask
 import dask.dataframe as dd
 import pandas as pd
 
+from optimus.engines.base.columns import n_largest_counts
 from optimus.engines.base.meta import Meta
 from optimus.helpers.columns import parse_columns, name_col
 from optimus.helpers.constants import Actions
@@ -11,6 +12,10 @@ from optimus.profiler.functions import fill_missing_var_types
 from optimus.engines.base.distributed.columns import DistributedBaseColumns
 
 
+def _value_counts(series):
+    return series.value_counts(dropna=False, sort=False)
+
+
 class DaskBaseColumns(DistributedBaseColumns):
 
     def exec_agg(self, exprs, compute):
@@ -21,12 +26,24 @@ class DaskBaseColumns(DistributedBaseColumns):
         :return:
         """
 
-        result = self.F.delayed(self.format_agg)(exprs)
-        
         if compute:
-            result = self.F.compute(result)
+            # Computing the expressions themselves, instead of a delayed call that receives them, lets Dask run the
+            # dataframe optimizations over their graphs
+            return self.format_agg(self.F.compute(exprs))
+
+        return self.F.delayed(self.format_agg)(exprs)
+
+    def _n_largest(self, series, n, include_uniques):
+        # Every partition is counted on its own and only the counts are merged, keeping the order in which the
+        # values first appear so ties are broken like in a single value count
+        concat = self.F._partition_engine.concat
+
+        def merge_counts(value_counts):
+            value_counts = concat(value_counts).groupby(level=0, sort=False, dropna=False).sum()
+            return n_largest_counts(value_counts, n, include_uniques)
 
-        return result
+        value_counts = [dask.delayed(_value_counts)(partition) for partition in series.to_delayed()]
+        return dask.delayed(merge_counts)(value_counts)
 
     def append(self, dfs):
         """
@@ -79,19 +96,15 @@ class DaskBaseColumns(DistributedBaseColumns):
 
         output_ordered_columns = df.cols.names()
 
+        # str.cat joins every column in a single pass instead of building an intermediate column per concatenation
         def _nest_string(row):
-            v = row[cols[0]].astype(str)
-            for i in range(1, len(cols)):
-                v = v + separator + row[cols[i]].astype(str)
-            return v
+            return row[cols[0]].astype(str).str.cat([row[col].astype(str) for col in cols[1:]], sep=separator)
 
         def _nest_array(row):
             # https://stackoverflow.com/questions/43898035/pandas-combine-column-values-into-a-list-in-a-new-column/43898233
             # t['combined'] = t.values.tolist()
 
-            v = row[cols[0]].astype(str)
-            for i in range(1, len(cols)):
-                v += ", " + row[cols[i]].astype(str)
+            v = row[cols[0]].astype(str).str.cat([row[col].astype(str) for col in cols[1:]], sep=", ")
             return "[" + v + "]"
 
         if shape == "string":
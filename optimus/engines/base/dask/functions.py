@@ -1,18 +1,19 @@
 from abc import abstractmethod
+from collections import OrderedDict
 import re
 
 import dask
 import dask.dataframe as dd
 import hiurlparser
-import numpy as np
 from dask.delayed import delayed
 from dask_ml.preprocessing import MinMaxScaler, StandardScaler
 from sklearn.preprocessing import MaxAbsScaler
-from dask_ml.impute import SimpleImputer
 from optimus.engines.base.distributed.functions import DistributedBaseFunctions
 from optimus.helpers.core import one_tuple_to_val, val_to_list
 from optimus.infer import is_list
 
+TO_FLOAT_CACHE_SIZE = 128
+
 
 class DaskBaseFunctions(DistributedBaseFunctions):
     _engine = dask
@@ -83,7 +84,17 @@ class DaskBaseFunctions(DistributedBaseFunctions):
 
     def to_float(self, series):
         if getattr(series, "map_partitions", False):
-            return self.map_partitions(series, self._to_float)
+            # Reuse the conversion of a series already converted, keyed by its graph name, so the math and stats
+            # functions called over the same column share one parse of its values
+            cache = self.__dict__.setdefault("_to_float_cache", OrderedDict())
+            key = (series._name, str(series.dtype))
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                cache[key] = self.map_partitions(series, self._to_float)
+                if len(cache) > TO_FLOAT_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return cache[key]
         else:
             return self._to_float(series)
 
@@ -93,29 +104,15 @@ class DaskBaseFunctions(DistributedBaseFunctions):
         else:
             return self._to_integer(series, default=default)
 
-    def to_datetime(self, series):
+    def to_datetime(self, series, format=None):
         if getattr(series, "map_partitions", False):
-            return self.map_partitions(series, self._to_datetime)
+            return self.map_partitions(series, self._to_datetime, format)
         else:
-            return self._to_float(series)
+            return self._to_datetime(series, format)
 
     def duplicated(self, dfd, keep, subset):
         return self.from_dataframe(self.to_dataframe(dfd).duplicated(keep=keep, subset=subset))
 
-    def impute(self, series, strategy, fill_value):
-
-        imputer = SimpleImputer(strategy=strategy, fill_value=fill_value)
-        series_fit = series.dropna()
-        if str(series.dtype) in self.constants.OBJECT_TYPES:
-            series_fit = series_fit.astype(str)
-        values = series_fit.values.reshape(-1, 1)
-        if len(values):
-            imputer.fit(values)
-            return imputer.transform(series.fillna(np.nan).values.reshape(-1, 1))
-        else:
-            logger.warn("list to fit imputer is empty, try cols.fill_na instead.")
-            return series
-
     @staticmethod
     def delayed(func):
         def wrapper(*args, **kwargs):
@@ -214,4 +211,11 @@ class DaskBaseFunctions(DistributedBaseFunctions):
                 series = self._replace_string(series, _to_replace, _value, regex)
             return series
 
+        if regex:
+            return self._replace_regex(series, to_replace, value)
+
         return series.replace(to_replace, value, regex=regex)
+
+    @staticmethod
+    def _replace_regex(series, to_replace, value):
+        return series.replace(to_replace, value, regex=True)
@@ -42,8 +42,8 @@ class DataFrameBaseFunctions(BaseFunctions, ABC):
     def reverse(self, series):
         return self.to_string(series).map(lambda v: v[::-1])
 
-    def word_tokenize(self, series):
-        return self.to_string(series).map(word_tokenize, na_action=None)
+    def word_tokenize(self, series, engine="nltk"):
+        return word_tokenize(self.to_string(series), engine)
 
     def standard_scaler(self, series):
         return StandardScaler().fit_transform(self.to_float(series).values.reshape(-1, 1))
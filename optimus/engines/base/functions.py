@@ -13,6 +13,7 @@ from optimus.helpers.constants import ProfilerDataTypes, ProfilerDataTypesNumeri
 from optimus.helpers.core import one_list_to_val, one_tuple_to_val, val_to_list
 from optimus.helpers.decorators import apply_to_categories
 from optimus.helpers.logger import logger
+from optimus.helpers.raiseit import RaiseIt
 from optimus.infer import is_list, is_list_of_list, is_valid_datetime_format, \
     is_list_of_int, is_list_of_str, \
     regex_int_compiled, regex_decimal_compiled, regex_credit_card_compiled, regex_email_compiled, \
@@ -309,23 +310,44 @@ class BaseFunctions(ABC):
         """
         return dfd.duplicated(keep=keep, subset=subset)
 
-    def impute(self, series, strategy, fill_value):
+    def impute_statistic(self, series, strategy):
         """
-        Impute missing values in a series
+        Get the value used to impute the missing values of a series using a strategy
         """
-        from sklearn.impute import SimpleImputer
-        imputer = SimpleImputer(strategy=strategy, fill_value=fill_value)
-        series_fit = series.dropna()
+        series = series.dropna()
         if str(series.dtype) in self.constants.OBJECT_TYPES:
-            series_fit = series_fit.astype(str)
-        values = series_fit.values.reshape(-1, 1)
-        if len(values):
-            imputer.fit(values)
-            return imputer.transform(series.fillna(np.nan).values.reshape(-1, 1))
+            series = series.astype(str)
+
+        if strategy == "mean":
+            return series.mean()
+        elif strategy == "median":
+            return series.quantile(0.5)
+        elif strategy == "most_frequent":
+            # Ties are resolved using the smallest value
+            return series.mode().min()
         else:
+            RaiseIt.value_error(strategy, ["mean", "median", "most_frequent", "constant"])
+
+    def impute(self, series, strategy, fill_value, statistic=None):
+        """
+        Impute missing values in a series. 'statistic' can be passed if it was already computed using
+        impute_statistic
+        """
+        if strategy == "constant":
+            if fill_value is None:
+                string_types = self.constants.OBJECT_TYPES + self.constants.STRING_TYPES
+                fill_value = "missing_value" if str(series.dtype) in string_types else 0
+            return series.fillna(fill_value)
+
+        if statistic is None:
+            statistic = self.compute(self.impute_statistic(series, strategy))
+
+        if pd.isnull(statistic):
             logger.warn("list to fit imputer is empty, try cols.fill_na instead.")
             return series
 
+        return series.fillna(statistic)
+
     # Aggregation
     def date_format(self, series):
         """
@@ -578,7 +600,10 @@ class BaseFunctions(ABC):
 
         return self.map_delayed(self.to_string(series), lemmatize_verbs_map, na_action=None)
 
-    def word_tokenize(self, series):
+    def word_tokenize(self, series, engine="nltk"):
+        if engine == "regex":
+            return self.to_string_accessor(series).findall(r"\w+")
+
         import nltk
         w_tokenizer = nltk.tokenize.WhitespaceTokenizer()
 
@@ -744,10 +769,12 @@ class BaseFunctions(ABC):
 
     def replace_chars(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
-        if ignore_case:
-            str_regex = [r'(?i)%s' % re.escape(s) for s in search]
+        prefix = r'(?i)' if ignore_case else ''
+        if is_list(replace_by):
+            str_regex = [prefix + re.escape(s) for s in search]
         else:
-            str_regex = [r'%s' % re.escape(s) for s in search]
+            # A single alternation replaces every substring in one pass over the column
+            str_regex = prefix + r'(?:%s)' % '|'.join([re.escape(s) for s in search])
         return self._replace_string(self.to_string(series), str_regex, replace_by, regex=True)
 
     def replace_words(self, series, search, replace_by, ignore_case):
@@ -258,8 +258,7 @@ class BaseLoad:
 
         file_name = local_file_names[0][1]
         print(local_file_names, file, file_name, filepath_or_buffer)
-        df.meta = Meta.set(df.meta, "file_name", ntpath.basename(file_name))
-        df.meta = Meta.set(df.meta, "sheet_names", sheet_names)
+        df.meta = Meta.batch_set(df.meta, {"file_name": ntpath.basename(file_name), "sheet_names": sheet_names})
 
         return df
 
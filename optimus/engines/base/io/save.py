@@ -5,6 +5,18 @@ from optimus.helpers.types import *
 DEFAULT_MODE = "w"
 DEFAULT_NUM_PARTITIONS = 1
 
+# This character are invalid as column names by parquet
+PARQUET_INVALID_CHARACTERS = str.maketrans({c: "_" for c in " ,;{}()\n\t="})
+
+
+def parquet_column_name(col_name):
+    """
+    Replace the characters parquet does not accept in column names with "_"
+    :param col_name: Column name
+    :return:
+    """
+    return col_name.translate(PARQUET_INVALID_CHARACTERS)
+
 
 class BaseSave:
     def __init__(self, root: 'DataFrameType'):
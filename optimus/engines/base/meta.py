@@ -46,6 +46,21 @@ class Meta:
 
         return data
 
+    @staticmethod
+    def batch_set(meta, values: dict, missing=dict) -> dict:
+        """
+        Set multiple metadata keys copying the metadata only once
+        :param meta: Meta data to be modified
+        :param values: dict with the paths to the keys to be modified and their values
+        :param missing:
+        :return:
+        """
+        data = deepcopy(meta) if meta is not None else {}
+        for spec, value in values.items():
+            assign(data, spec, value, missing=missing)
+
+        return data
+
     @staticmethod
     def reset(meta, spec=None) -> dict:
         """
@@ -1,4 +1,7 @@
+import os
+import re
 from abc import ABC
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -9,6 +12,25 @@ from optimus.helpers.logger import logger
 from optimus.infer import is_int_like, is_list_or_tuple
 
 
+@lru_cache(maxsize=256)
+def _compile_match_regex(regex, regex_engine="re"):
+    """
+    Compile a regex used to match values. Cached so the masks of every column and partition reuse the compiled
+    pattern.
+    :param regex:
+    :param regex_engine: "re" or "re2". RE2 must be installed and falls back to re for the patterns it does not
+    support, like lookarounds
+    :return:
+    """
+    if regex_engine == "re2":
+        import re2
+        try:
+            return re2.compile(regex)
+        except re2.error:
+            pass
+    return re.compile(regex)
+
+
 class PandasBaseFunctions(BaseFunctions, ABC):
 
     @staticmethod
@@ -23,6 +45,18 @@ class PandasBaseFunctions(BaseFunctions, ABC):
         self.intlike = isintlike
         return np.vectorize(self.intlike)(series).flatten()
 
+    def match(self, series, regex):
+        if not isinstance(series, pd.Series) or str(series.dtype) in self.constants.STRING_INTERNAL_TYPES:
+            return super().match(series, regex)
+        # Values are cast to str like in to_string_accessor, so every one of them is matched by the compiled
+        # pattern directly instead of through the str accessor callback. RE2 is used when the OPTIMUS_REGEX_ENGINE
+        # environment variable is set to "re2"
+        match = _compile_match_regex(regex, os.environ.get("OPTIMUS_REGEX_ENGINE", "re")).match
+        values = series.astype(str).to_numpy(dtype=object)
+        return pd.Series(np.fromiter((match(value) is not None for value in values),
+                                     dtype=bool, count=len(values)),
+                         index=series.index, name=series.name)
+
     def is_float(self, series):
         if str(series.dtype) in self.constants.DATETIME_INTERNAL_TYPES:
             return False
@@ -48,6 +82,23 @@ class PandasBaseFunctions(BaseFunctions, ABC):
             int_type = False
             otypes = [object]
 
+        if int_type and series.dtype.kind in "biuf":
+            # Numeric values are truncated in a single vectorized pass instead of a fast_forceint call per value.
+            # Missing values and values out of the int64 range get the default value
+            result = np.full(len(series), default, dtype=np.int64)
+            if series.dtype.kind == "f":
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                valid = np.isfinite(values) & (np.abs(values) < 2 ** 63)
+                result[valid] = np.trunc(values[valid])
+            else:
+                unsigned = series.dtype.kind == "u"
+                values = series.to_numpy(dtype=np.uint64 if unsigned else np.int64, na_value=0)
+                valid = series.notna().to_numpy()
+                if unsigned:
+                    valid &= values <= np.iinfo(np.int64).max
+                result[valid] = values[valid]
+            return pd.Series(result, index=series.index, name=series.name)
+
         try:
             if default is not None:
                 series = series.fillna(default)
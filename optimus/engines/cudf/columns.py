@@ -1,10 +1,11 @@
 import builtins
 from sklearn.preprocessing import StandardScaler
 
-from optimus.engines.base.commons.functions import string_to_index, index_to_string, find
+from optimus.engines.base.commons.functions import find
 from optimus.engines.base.cudf.columns import CUDFBaseColumns
 from optimus.engines.base.dataframe.columns import DataFrameBaseColumns
 from optimus.helpers.columns import parse_columns, get_output_cols
+from optimus.helpers.constants import Actions
 from optimus.helpers.raiseit import RaiseIt
 from optimus.infer import is_dict, is_list, is_tuple
 
@@ -175,13 +176,15 @@ class Cols(CUDFBaseColumns, DataFrameBaseColumns):
         from cuml import preprocessing
         df = self.root
         df.le = df.le or preprocessing.LabelEncoder()
-        return string_to_index(df, cols, output_cols, df.le)
+        return df.cols.apply(cols, self.F.string_to_index, args=(df.le,), output_cols=output_cols,
+                             meta_action=Actions.STRING_TO_INDEX.value, mode="vectorized")
 
     def index_to_string(self, cols=None, output_cols=None):
         from cuml import preprocessing
         df = self.root
         df.le = df.le or preprocessing.LabelEncoder()
-        return index_to_string(df, cols, output_cols, df.le)
+        return df.cols.apply(cols, self.F.index_to_string, args=(df.le,), output_cols=output_cols,
+                             meta_action=Actions.INDEX_TO_STRING.value, mode="vectorized")
 
     def _unnest(self, dfd, input_col, final_columns, separator, splits, mode, output_cols):
         if mode == "string":
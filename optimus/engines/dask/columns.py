@@ -1,7 +1,7 @@
-import builtins
 import numpy as np
-import dask.array as da
+import pandas as pd
 from dask_ml import preprocessing
+from fast_histogram import histogram1d
 
 from optimus.engines.base.commons.functions import string_to_index, index_to_string
 from optimus.engines.base.pandas.columns import PandasBaseColumns
@@ -13,6 +13,106 @@ from optimus.infer import is_dict, is_list, is_tuple
 from optimus.profiler.constants import MAX_BUCKETS
 
 
+def _to_float64(values):
+    """
+    Convert a partition series to float64, numeric partitions are read directly and anything else is coerced in
+    a single vectorized pass
+    :param values: Partition series
+    :return:
+    """
+    if values.dtype.kind not in "biuf":
+        values = pd.to_numeric(values, errors="coerce")
+    return pd.Series(values.to_numpy(dtype=np.float64, na_value=np.nan), index=values.index, name=values.name)
+
+
+def _hist_range(_range):
+    """
+    Get the edges np.histogram would use for a range, None if the range is not finite
+    :param _range: Lower and upper values
+    :return:
+    """
+    _lower, _upper = float(_range[0]), float(_range[1])
+    if not (np.isfinite(_lower) and np.isfinite(_upper)):
+        return None
+    if _lower == _upper:
+        return _lower - 0.5, _upper + 0.5
+    return _lower, _upper
+
+
+def _hist(values, buckets, _range):
+    """
+    Count the values of a partition in buckets of the same width
+    :param values: Partition series
+    :param buckets: Number of buckets
+    :param _range: Lower and upper edges of the buckets
+    :return:
+    """
+    _range = _hist_range(_range)
+    if _range is None:
+        return np.zeros(buckets, dtype=np.int64)
+    values = _to_float64(values).to_numpy()
+    values = values[~np.isnan(values)]
+    # Regular buckets are indexed with arithmetic instead of a binary search over the edges
+    _count = histogram1d(values, bins=buckets, range=_range).astype(np.int64)
+    # np.histogram counts the values equal to the upper edge in the last bucket, fast_histogram leaves them out
+    _count[-1] += np.count_nonzero(values == _range[1])
+    return _count
+
+
+def _min_max_partition(pdf, cols):
+    """
+    Get the float64 min and max of every column of a partition
+    :param pdf: Partition dataframe
+    :param cols: Columns to check
+    :return: Array with the mins in the first row and the maxs in the second
+    """
+    values = [_to_float64(pdf[col_name]) for col_name in cols]
+    return np.array([[v.min() for v in values], [v.max() for v in values]], dtype=np.float64)
+
+
+def _merge_min_max(parts, cols):
+    """
+    Merge the mins and maxs of the partitions into a range by column
+    :param parts: Arrays returned by _min_max_partition
+    :param cols: Columns in the order of the arrays
+    :return:
+    """
+    parts = np.stack(parts)
+    # fmin and fmax skip nan unless every partition is nan
+    _mins = np.fmin.reduce(parts[:, 0], axis=0)
+    _maxs = np.fmax.reduce(parts[:, 1], axis=0)
+    return {col_name: (_mins[i], _maxs[i]) for i, col_name in enumerate(cols)}
+
+
+def _hist_partition(pdf, cols, buckets, ranges):
+    """
+    Count the values of every column of a partition in buckets of the same width
+    :param pdf: Partition dataframe
+    :param cols: Columns to count
+    :param buckets: Number of buckets
+    :param ranges: Lower and upper edges of the buckets by column
+    :return: Array with the counts of each column in a row
+    """
+    counts = np.empty((len(cols), buckets), dtype=np.int64)
+    for i, col_name in enumerate(cols):
+        counts[i] = _hist(pdf[col_name], buckets, ranges[col_name])
+    return counts
+
+
+def _hist_to_dict(hist):
+    """
+    Format the counts and edges arrays of every column as the lists of buckets returned by hist
+    :param hist: Dict with a tuple of counts and edges arrays by column
+    :return:
+    """
+    _result = {}
+    for col_name, (_count, _bins) in hist.items():
+        _bins = _bins.tolist()
+        _result[col_name] = [{"lower": lower, "upper": upper, "count": count} for lower, upper, count in
+                             zip(_bins[:-1], _bins[1:], _count.tolist())]
+    return {"hist": _result}
+
+
 class Cols(PandasBaseColumns, DaskBaseColumns):
     def __init__(self, df):
         super().__init__(df)
@@ -45,37 +145,42 @@ class Cols(PandasBaseColumns, DaskBaseColumns):
             _min = None
             _max = None
 
-        result = {}
-
-        for col_name in cols:
-            series = self.F.to_float(df.data[col_name])
-            _range = (_min[col_name], _max[col_name]) if _min is not None and _max is not None else (series.min(), series.max())
-            result[col_name] = da.histogram(series, bins=buckets, range=_range)
-
-        @self.F.delayed
-        def format_hist(_cols):
-            
-            _result = {}
-            for col_name in _cols:
+        partitions = df.data[cols].to_delayed()
 
-                _count, _bins = _cols[col_name]
+        if _min is not None and _max is not None:
+            _ranges = {col_name: (_min[col_name], _max[col_name]) for col_name in cols}
+        else:
+            # The min and max of every column are found in a single pass over the partitions
+            _ranges = self.F.delayed(_merge_min_max)([self.F.delayed(_min_max_partition)(partition, cols)
+                                                      for partition in partitions], cols)
+            # When computing, the ranges are materialized first so the counting tasks receive plain floats and
+            # do not wait on the reduction. Otherwise they stay lazy to return a single delayed result
+            if compute:
+                _ranges = self.F.compute(_ranges)
 
-                dr = {}
-                for i in builtins.range(len(_count)):
-                    key = (float(_bins[i]), float(_bins[i + 1]))
-                    if np.isnan(key[0]) and np.isnan(key[1]):
-                        continue
-                    dr[key] = dr.get(key, 0) + int(_count[i])
+        # Every column is counted in the same task, so each partition is read once
+        counts = [self.F.delayed(_hist_partition)(partition, cols, buckets, _ranges) for partition in partitions]
 
-                r = [{"lower": k[0], "upper": k[1], "count": count} for k, count in dr.items()]
-                if len(r):
-                    _result[col_name] = r
+        @self.F.delayed
+        def agg_hist(_partitions, _ranges):
+            # The counts of every partition are added in place, without stacking them in a temporary array
+            _counts = np.zeros((len(cols), buckets), dtype=np.int64)
+            for _partition in _partitions:
+                np.add(_counts, _partition, out=_counts)
 
-            return {"hist": _result}
+            _result = {}
+            for col_index, col_name in enumerate(cols):
+                _range = _hist_range(_ranges[col_name])
+                if _range is not None:
+                    _result[col_name] = (_counts[col_index], np.linspace(_range[0], _range[1], buckets + 1))
+            return _result
 
-        result = format_hist(result)
+        result = agg_hist(counts, _ranges)
 
+        # Counts and edges stay as arrays until the result is returned
         if compute:
-            result = self.F.compute(result)
+            result = _hist_to_dict(self.F.compute(result))
+        else:
+            result = self.F.delayed(_hist_to_dict)(result)
 
         return result
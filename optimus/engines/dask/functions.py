@@ -1,6 +1,8 @@
+import re
+
 import dask
 import dask.dataframe as dd
-import dask.array as da
+import numpy as np
 import pandas as pd
 from optimus.helpers.decorators import apply_to_categories
 
@@ -9,6 +11,17 @@ from optimus.engines.base.pandas.functions import PandasBaseFunctions
 from optimus.engines.base.dask.functions import DaskBaseFunctions
 
 
+def _replace_compiled_regex(series, pattern, value):
+    return series.str.replace(pattern, value, regex=True)
+
+
+def _format_date(series, current_format, output_format):
+    # Repeated dates are parsed and formatted once, strftime runs only over the unique values
+    codes, uniques = pd.factorize(pd.to_datetime(series, format=current_format, errors="coerce", cache=True))
+    formatted = np.append(np.asarray(uniques.strftime(output_format), dtype=object), np.nan)
+    return pd.Series(formatted[codes], index=series.index, name=series.name)
+
+
 class DaskFunctions(PandasBaseFunctions, DaskBaseFunctions):
 
     _partition_engine = pd
@@ -23,6 +36,10 @@ class DaskFunctions(PandasBaseFunctions, DaskBaseFunctions):
 
         return wrapper
 
+    def _map_ufunc(self, series, ufunc):
+        # The NumPy ufunc runs over every partition directly, without wrapping the series in a dask array
+        return self.map_partitions(self.to_float(series), ufunc)
+
     def kurtosis(self, series):
         return self.to_float(series.dropna()).kurtosis()
 
@@ -30,70 +47,88 @@ class DaskFunctions(PandasBaseFunctions, DaskBaseFunctions):
         return self.to_float(series.dropna()).skew()
 
     def exp(self, series):
-        return da.exp(self.to_float(series))
+        return self._map_ufunc(series, np.exp)
 
     def sqrt(self, series):
-        return da.sqrt(self.to_float(series))
+        return self._map_ufunc(series, np.sqrt)
 
     def reciprocal(self, series):
-        return da.reciprocal(self.to_float(series))
+        return self._map_ufunc(series, np.reciprocal)
 
     def unique_values(self, series, *args):
         return self.to_string(series).unique()
 
+    def count_uniques(self, series, estimate=False):
+        if estimate:
+            # HyperLogLog sketch, each partition is reduced to a fixed size sketch instead of its unique values
+            return self.delayed(round)(series.dropna().nunique_approx().to_delayed())
+        # Native values are hashed directly, casting to string is only needed to unify mixed types
+        if str(series.dtype) in self.constants.NUMERIC_INTERNAL_TYPES + self.constants.BOOLEAN_INTERNAL_TYPES + \
+                self.constants.DATETIME_INTERNAL_TYPES:
+            return series.nunique()
+        return self.to_string(series).nunique()
+
     def radians(self, series):
-        return da.radians(self.to_float(series))
+        return self._map_ufunc(series, np.radians)
 
     def degrees(self, series):
-        return da.degrees(self.to_float(series))
+        return self._map_ufunc(series, np.degrees)
 
     def ln(self, series):
-        return da.log(self.to_float(series))
+        return self._map_ufunc(series, np.log)
 
     def log(self, series, base=10):
-        return da.log(self.to_float(series)) / da.log(base)
+        # One log and one product by partition instead of dividing by a second log
+        factor = 1 / np.log(base)
+        return self.map_partitions(self.to_float(series), lambda _series: np.log(_series) * factor)
 
     def ceil(self, series):
-        return da.ceil(self.to_float(series))
+        return self._map_ufunc(series, np.ceil)
 
     def floor(self, series):
-        return da.floor(self.to_float(series))
+        return self._map_ufunc(series, np.floor)
 
     def sin(self, series):
-        return da.sin(self.to_float(series))
+        return self._map_ufunc(series, np.sin)
 
     def cos(self, series):
-        return da.cos(self.to_float(series))
+        return self._map_ufunc(series, np.cos)
 
     def tan(self, series):
-        return da.tan(self.to_float(series))
+        return self._map_ufunc(series, np.tan)
 
     def asin(self, series):
-        return da.arcsin(self.to_float(series))
+        return self._map_ufunc(series, np.arcsin)
 
     def acos(self, series):
-        return da.arccos(self.to_float(series))
+        return self._map_ufunc(series, np.arccos)
 
     def atan(self, series):
-        return da.arctan(self.to_float(series))
+        return self._map_ufunc(series, np.arctan)
 
     def sinh(self, series):
-        return da.arcsinh(self.to_float(series))
+        return self._map_ufunc(series, np.arcsinh)
 
     def cosh(self, series):
-        return da.cosh(self.to_float(series))
+        return self._map_ufunc(series, np.cosh)
 
     def tanh(self, series):
-        return da.tanh(self.to_float(series))
+        return self._map_ufunc(series, np.tanh)
 
     def asinh(self, series):
-        return da.arcsinh(self.to_float(series))
+        return self._map_ufunc(series, np.arcsinh)
 
     def acosh(self, series):
-        return da.arccosh(self.to_float(series))
+        return self._map_ufunc(series, np.arccosh)
 
     def atanh(self, series):
-        return da.arctanh(self.to_float(series))
+        return self._map_ufunc(series, np.arctanh)
+
+    @staticmethod
+    def _replace_regex(series, to_replace, value):
+        # The pattern is compiled once and shipped to every partition
+        pattern = re.compile(to_replace)
+        return series.map_partitions(_replace_compiled_regex, pattern, value, meta=(series.name, "object"))
 
     @apply_to_categories
     def normalize_chars(self, series):
@@ -101,7 +136,7 @@ class DaskFunctions(PandasBaseFunctions, DaskBaseFunctions):
         return series.str.normalize("NFKD").str.encode('ascii', errors='ignore').str.decode('utf8').astype(str)
 
     def format_date(self, series, current_format=None, output_format=None):
-        return dd.to_datetime(series, format=current_format, errors="coerce").dt.strftime(output_format)
+        return series.map_partitions(_format_date, current_format, output_format, meta=(series.name, "object"))
 
     def time_between(self, series, value=None, date_format=None):
 
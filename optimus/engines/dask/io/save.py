@@ -1,6 +1,6 @@
 import os
 
-from optimus.engines.base.io.save import BaseSave, DEFAULT_MODE
+from optimus.engines.base.io.save import BaseSave, DEFAULT_MODE, parquet_column_name
 from optimus.helpers.functions import prepare_path_local, path_is_local
 from optimus.helpers.logger import logger
 
@@ -48,15 +48,7 @@ class Save(BaseSave):
     def parquet(self, path, mode=DEFAULT_MODE, num_partitions=1, engine="pyarrow", storage_options=None, conn=None,
                 **kwargs):
 
-        # This character are invalid as column names by parquet
-        invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-        def func(col_name):
-            for i in invalid_character:
-                col_name = col_name.replace(i, "_")
-            return col_name
-
-        df = self.root.cols.rename(func)
+        df = self.root.cols.rename(parquet_column_name)
 
         if conn is not None:
             path = conn.path(path)
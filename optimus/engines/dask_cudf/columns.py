@@ -3,7 +3,7 @@ import dask
 import fastnumbers
 from dask_ml import preprocessing
 
-from optimus.engines.base.commons.functions import string_to_index, index_to_string, impute
+from optimus.engines.base.commons.functions import string_to_index, index_to_string
 from optimus.engines.base.dask.columns import DaskBaseColumns
 from optimus.engines.base.cudf.columns import CUDFBaseColumns
 from optimus.helpers.columns import parse_columns
@@ -1,3 +1,5 @@
+import tempfile
+
 import dask, distributed
 from distributed import Client, get_client
 
@@ -10,9 +12,15 @@ from optimus.optimus import Engine, EnginePretty
 BIG_NUMBER = 100000
 
 
+def _enable_cudf_spill():
+    import cudf
+    cudf.set_option("spill", True)
+    return True
+
+
 class DaskCUDFEngine(BaseEngine):
     def __init__(self, session=None, address=None, n_workers=1, threads_per_worker=8, processes=False,
-                 memory_limit=None, verbose=False, coiled_token=None, *args, **kwargs):
+                 memory_limit=None, verbose=False, coiled_token=None, rmm_pool_size=0.8, spill=True, *args, **kwargs):
 
         """
 
@@ -21,6 +29,8 @@ class DaskCUDFEngine(BaseEngine):
         :param threads_per_worker:
         :param memory_limit:
         :param verbose:
+        :param rmm_pool_size: RMM pool size for a local cluster, as a fraction of the device memory or a size string
+        :param spill: Let cuDF spill device buffers to host memory instead of running out of memory
         :param comm:
         :param args:
         :param kwargs:
@@ -86,15 +96,14 @@ class DaskCUDFEngine(BaseEngine):
                     n_workers = n_gpus
                     # n_gpus = 1
 
-                memoryTotal = GPUtil.getGPUs()[available_gpus[0]].memoryTotal
-
-                cluster = LocalCUDACluster(rmm_pool_size=memoryTotal,
-                                           device_memory_limit=memoryTotal * 0.8
-                                           # Spill to RAM when 80% memory is full
-                                           )
+                cluster = LocalCUDACluster(rmm_pool_size=rmm_pool_size, enable_cudf_spill=spill,
+                                           local_directory=tempfile.gettempdir())
                 memory_limit = memory_limit or '4GB'
                 self.client = Client(cluster, memory_limit=memory_limit, *args, **kwargs)
 
+        if spill and not coiled_token:
+            self.client.run(_enable_cudf_spill)
+
         if use_remote:
             self.remote = RemoteOptimusInterface(self.client, Engine.DASK_CUDF.value)
 
@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+
+
+def compat_mode(use_gds=True):
+    """
+    Get the KvikIO compatibility mode for a read or a write. AUTO lets KvikIO move the bytes from storage to device
+    memory through cuFile when GPUDirect Storage is available, ON forces the POSIX path through a host buffer.
+    :param use_gds: Use AUTO if True, ON if False.
+    :return: The mode in the format of the installed KvikIO release.
+    """
+    import kvikio
+
+    if hasattr(kvikio, "CompatMode"):
+        return kvikio.CompatMode.AUTO if use_gds else kvikio.CompatMode.ON
+
+    # Before the CompatMode enum KvikIO only had a boolean, where False means try cuFile
+    return not use_gds
+
+
+def set_compat_mode(mode):
+    """
+    Set the KvikIO compatibility mode of the current process. Nothing is changed if KvikIO is not installed.
+    :param mode: Mode returned by compat_mode.
+    :return: The previous mode, or None if KvikIO is not installed.
+    """
+    try:
+        import kvikio
+        import kvikio.defaults
+    except ImportError:
+        return None
+
+    if hasattr(kvikio, "CompatMode"):
+        previous = kvikio.defaults.get("compat_mode")
+        kvikio.defaults.set("compat_mode", mode)
+    else:
+        previous = kvikio.defaults.compat_mode()
+        kvikio.defaults.compat_mode_reset(mode)
+
+    return previous
+
+
+def _set_gds(use_gds):
+    try:
+        mode = compat_mode(use_gds)
+    except ImportError:
+        return None
+
+    return set_compat_mode(mode)
+
+
+def _client():
+    try:
+        from distributed import get_client
+        return get_client()
+    except (ImportError, ValueError):
+        return None
+
+
+def enable_gds(use_gds=True):
+    """
+    Set the KvikIO compatibility mode in this process and in every worker of the running Dask client, so lazily
+    read partitions use it when they are computed.
+    :param use_gds: Use GPUDirect Storage when it is available if True, the POSIX path if False.
+    :return: A tuple with the previous mode of this process and a dict with the previous mode of every worker.
+    """
+    previous = _set_gds(use_gds)
+    client = _client()
+    workers_previous = client.run(_set_gds, use_gds) if client is not None else {}
+
+    return previous, workers_previous
+
+
+@contextmanager
+def gds(use_gds=True):
+    """
+    Set the KvikIO compatibility mode in this process and in the workers for the duration of an eager read or write.
+    The previous modes are restored on exit.
+    :param use_gds: Use GPUDirect Storage when it is available if True, the POSIX path if False.
+    """
+    previous, workers_previous = enable_gds(use_gds)
+
+    try:
+        yield
+    finally:
+        if previous is not None:
+            set_compat_mode(previous)
+
+        client = _client()
+        if client is not None:
+            for worker, mode in workers_previous.items():
+                if mode is not None:
+                    client.run(set_compat_mode, mode, workers=[worker])
@@ -1,6 +1,9 @@
+import glob
 import ntpath
+import os
 
 import dask.bag as db
+import fsspec
 import pandas as pd
 from dask import dataframe as dd
 
@@ -8,17 +11,37 @@ from optimus.engines.base.basedataframe import BaseDataFrame
 from optimus.engines.base.io.load import BaseLoad
 from optimus.engines.base.meta import Meta
 from optimus.engines.dask_cudf.dataframe import DaskCUDFDataFrame
+from optimus.engines.dask_cudf.io.gds import enable_gds
 from optimus.helpers.functions import prepare_path, unquote_path
 from optimus.helpers.logger import logger
+from optimus.helpers.raiseit import RaiseIt
+
+EXCEL_PARTITION_ROWS = 200000
+
+
+def _prefetch(path):
+    """
+    Ask the kernel to start reading a local file into the page cache, so the workers don't block on cold reads
+    once the parser starts. Remote paths and platforms without posix_fadvise are left untouched.
+    """
+    if not hasattr(os, "posix_fadvise") or not isinstance(path, str) or not os.path.isfile(path):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
 
 
 class Load(BaseLoad):
 
-    def json(self, path, multiline=False, storage_options=None, conn=None, *args, **kwargs):
+    def json(self, path, multiline=False, storage_options=None, conn=None, blocksize="128 MiB", *args, **kwargs):
         """
         Return a dask dataframe from a json file.
         :param path: path or location of the file.
         :param multiline:
+        :param blocksize: Size of the chunks line delimited files are read in, so the whole file is not decoded in
+            a single GPU allocation. chunk_size is accepted as an alias.
 
         :return:
         """
@@ -29,13 +52,15 @@ class Load(BaseLoad):
             path = conn.path(path)
             storage_options = conn.storage_options
 
-        file, file_name = prepare_path(path, "json")[0]
+        blocksize = kwargs.pop("chunk_size", None) or blocksize
 
         try:
             import dask_cudf
+            if multiline:
+                kwargs["blocksize"] = blocksize
             df = dask_cudf.read_json(path, lines=multiline, storage_options=storage_options, *args, **kwargs)
             df = DaskCUDFDataFrame(df, op=self.op)
-            df.meta = Meta.set(df.meta, "file_name", file_name)
+            df.meta = Meta.set(df.meta, "file_name", ntpath.basename(path))
 
         except IOError as error:
             logger.print(error)
@@ -44,8 +69,7 @@ class Load(BaseLoad):
 
     def csv(self, filepath_or_buffer, sep=',', header=True, infer_schema=True, encoding="utf-8", null_value="None", n_rows=-1, cache=False,
             quoting=0, lineterminator=None, on_bad_lines=False, engine="c", keep_default_na=True, na_filter=True,
-            storage_options=None, conn=None, *args, **kwargs):
-
+            storage_options=None, conn=None, use_gds=True, prefetch=False, *args, **kwargs):
 
         filepath_or_buffer = unquote_path(filepath_or_buffer)
 
@@ -59,9 +83,25 @@ class Load(BaseLoad):
             logger.print(f"{remove_param} is not supported. Used to preserve compatibility with Optimus Pandas")
             kwargs.pop(remove_param)
 
+        enable_gds(use_gds)
+
+        if prefetch and engine == "c":
+            _prefetch(filepath_or_buffer)
+
         try:
             import dask_cudf
-            if engine == "python":
+            # cudf.read_csv has no engine or on_bad_lines options, so only the default C parser is pushed down
+            pushdown = n_rows > -1 and engine == "c" and not on_bad_lines and \
+                not glob.has_magic(filepath_or_buffer)
+            if pushdown:
+                # Let the GPU parser stop after n_rows instead of decoding the whole file and slicing it afterwards
+                import cudf
+                cdf = cudf.read_csv(filepath_or_buffer, sep=sep, header=0 if header else None, encoding=encoding,
+                                    quoting=quoting, keep_default_na=True, na_values=None, na_filter=na_filter,
+                                    nrows=n_rows, storage_options=storage_options, *args, **kwargs)
+                dcdf = dask_cudf.from_cudf(cdf, npartitions=1)
+
+            elif engine == "python":
 
                 # na_filter=na_filter, on_bad_lines and low_memory are not support by pandas engine
                 dcdf = dask_cudf.read_csv(filepath_or_buffer, sep=sep, header=0 if header else None, encoding=encoding,
@@ -74,12 +114,13 @@ class Load(BaseLoad):
                                           keep_default_na=True, na_values=None, engine=engine, na_filter=na_filter,
                                           storage_options=storage_options, low_memory=False, *args, **kwargs)
 
-            if n_rows > -1:
-                dcdf = dask_cudf.from_cudf(dcdf.head(n=n_rows), npartitions=1).reset_index(drop=True)
+            if n_rows > -1 and not pushdown:
+                # The first partition already has a zero based index, no need to reset it
+                dcdf = dcdf.head(n=n_rows, npartitions=1, compute=False)
 
             df = DaskCUDFDataFrame(dcdf, op=self.op)
-            df.meta = Meta.set(df.meta, "file_name", filepath_or_buffer)
-            df.meta = Meta.set(df.meta, "name", ntpath.basename(filepath_or_buffer))
+            df.meta = Meta.batch_set(df.meta, {"file_name": filepath_or_buffer,
+                                               "name": ntpath.basename(filepath_or_buffer)})
         except IOError as error:
             logger.print(error)
             raise
@@ -87,7 +128,19 @@ class Load(BaseLoad):
         return df
 
     @staticmethod
-    def _parquet(path, columns=None, storage_options=None, conn=None, *args, **kwargs):
+    def _parquet(path, columns=None, storage_options=None, conn=None, use_gds=True, filters=None, row_groups=None,
+                 use_pandas_metadata=None, split_row_groups=None, *args, **kwargs):
+        """
+        Read a parquet file pushing the column projection and the row group selection down to libcudf, so only the
+        requested data is moved to the GPU and decoded.
+
+        :param columns: Columns to read.
+        :param filters: Row group filters like [("col", "==", value)]. Row groups whose statistics can not match
+            are skipped.
+        :param row_groups: Row groups to read.
+        :param use_pandas_metadata: Use the pandas metadata stored in the file to rebuild the index.
+        :param split_row_groups: Create one partition per row group, so filters can be applied per partition.
+        """
 
         path = unquote_path(path)
 
@@ -95,14 +148,16 @@ class Load(BaseLoad):
             path = conn.path(path)
             storage_options = conn.storage_options
 
-        file, file_name = prepare_path(path, "parquet")
+        enable_gds(use_gds)
 
         try:
             import dask_cudf
+            options = {"filters": filters, "row_groups": row_groups, "use_pandas_metadata": use_pandas_metadata,
+                       "split_row_groups": split_row_groups}
+            kwargs.update({key: value for key, value in options.items() if value is not None})
+            # dask_cudf lists the files and gathers the footers itself, on any filesystem supported by fsspec
             df = dask_cudf.read_parquet(path, columns=columns, storage_options=storage_options, *args, **kwargs)
 
-            df.meta = Meta.set(df.meta, "file_name", file_name)
-
         except IOError as error:
             logger.print(error)
             raise
@@ -131,8 +186,17 @@ class Load(BaseLoad):
 
         return df
 
-    @staticmethod
-    def excel(path, sheet_name=0, storage_options=None, conn=None, *args, **kwargs):
+    def excel(self, path, sheet_name=0, storage_options=None, conn=None, n_partitions=None, *args, **kwargs):
+        """
+        Loads a dataframe from an Excel file. The sheet is decoded on the CPU and moved to the GPU at once.
+
+        :param path: path or location of the file. Must be string dataType.
+        :param sheet_name: excel sheet name
+        :param storage_options: A dict with the connection params.
+        :param conn: A connection object.
+        :param n_partitions: Number of partitions of the resulting dataframe. One partition by
+        EXCEL_PARTITION_ROWS rows if not set.
+        """
 
         path = unquote_path(path)
 
@@ -140,13 +204,14 @@ class Load(BaseLoad):
             path = conn.path(path)
             storage_options = conn.storage_options
 
-        file, file_name = prepare_path(path, "xls")
+        file, file_name = prepare_path(path, "xls")[0]
 
         try:
+            import cudf
+            import dask_cudf
             pdf = pd.read_excel(file, sheet_name=sheet_name, storage_options=storage_options, *args, **kwargs)
 
-            # Parse object column data type to string to ensure that Spark can handle it. With this we try to reduce
-            # exception when Spark try to infer the column data type
+            # Parse object column data type to string, cuDF can not hold mixed Python objects
             col_names = list(pdf.select_dtypes(include=['object']))
 
             column_dtype = {}
@@ -156,11 +221,126 @@ class Load(BaseLoad):
             # Convert object columns to string
             pdf = pdf.astype(column_dtype)
 
-            # Create data frame
-            df = dd.from_pandas(pdf, npartitions=3)
+            if n_partitions is None:
+                n_partitions = max(1, len(pdf) // EXCEL_PARTITION_ROWS)
+
+            # Move the data to the GPU once and split it there
+            dcdf = dask_cudf.from_cudf(cudf.from_pandas(pdf), npartitions=n_partitions)
+            df = DaskCUDFDataFrame(dcdf, op=self.op)
             df.meta = Meta.set(df.meta, "file_name", ntpath.basename(file_name))
         except IOError as error:
             logger.print(error)
             raise
 
         return df
+
+    def orc(self, path, columns=None, storage_options=None, conn=None, n_partitions=None, use_gds=True, *args,
+            **kwargs):
+        """
+        Loads a dataframe from an ORC file using the cuDF GPU reader.
+
+        :param path: path or location of the file. Must be string dataType.
+        :param columns: Specific column names to be loaded from the file.
+        :param storage_options: A dict with the connection params.
+        :param conn: A connection object.
+        :param n_partitions: Number of partitions of the resulting dataframe.
+        :param use_gds: Read the file through KvikIO, using GPUDirect Storage when it is available.
+        """
+
+        path = unquote_path(path)
+
+        if conn is not None:
+            path = conn.path(path)
+            storage_options = conn.storage_options
+
+        enable_gds(use_gds)
+
+        try:
+            import dask_cudf
+            dcdf = dask_cudf.read_orc(path, columns=columns, storage_options=storage_options, *args, **kwargs)
+
+            if n_partitions is not None:
+                dcdf = dcdf.repartition(npartitions=n_partitions)
+
+            df = DaskCUDFDataFrame(dcdf, op=self.op)
+            df.meta = Meta.batch_set(df.meta, {"file_name": path, "name": ntpath.basename(path)})
+        except IOError as error:
+            logger.print(error)
+            raise
+
+        return df
+
+    def hdf5(self, path, columns=None, n_partitions=None, key="/*", *args, **kwargs):
+        """
+        Loads a dataframe from a HDF5 file. HDF5 is decoded on the CPU, each partition is moved to the GPU.
+
+        :param path: path or location of the file. Must be string dataType.
+        :param columns: Specific column names to be loaded from the file.
+        :param n_partitions: Number of partitions of the resulting dataframe.
+        :param key: Group identifier in the store. Can contain a wildcard.
+        """
+
+        path = unquote_path(path)
+
+        try:
+            import dask_cudf
+            dcdf = dask_cudf.from_dask_dataframe(dd.read_hdf(path, key, columns=columns, *args, **kwargs))
+
+            if n_partitions is not None:
+                dcdf = dcdf.repartition(npartitions=n_partitions)
+
+            df = DaskCUDFDataFrame(dcdf, op=self.op)
+            df.meta = Meta.batch_set(df.meta, {"file_name": path, "name": ntpath.basename(path)})
+        except IOError as error:
+            logger.print(error)
+            raise
+
+        return df
+
+    def zip(self, path, filename, dest=None, columns=None, storage_options=None, conn=None, n_partitions=None,
+            *args, **kwargs):
+        """
+        Loads a file inside a zip archive without extracting it, reading it through the fsspec zip protocol.
+
+        :param path: path or location of the zip file.
+        :param filename: name of the file inside the zip to be loaded.
+        :param dest: Not used. The file is read from the archive directly.
+        :param columns: Specific column names to be loaded from the file.
+        :param storage_options: A dict with the connection params of the zip file location.
+        :param conn: A connection object.
+        :param n_partitions: Number of partitions of the resulting dataframe.
+        """
+
+        path = unquote_path(path)
+
+        if conn is not None:
+            path = conn.path(path)
+            storage_options = conn.storage_options
+
+        protocol = fsspec.core.split_protocol(path)[0] or "file"
+        member_path = f"zip://{filename}::{path}"
+        member_storage_options = {protocol: storage_options} if storage_options else None
+
+        file_type = os.path.splitext(filename)[1].replace(".", "").lower()
+
+        if file_type in ["csv", "tsv", "txt"]:
+            if file_type == "tsv":
+                kwargs.setdefault("sep", "\t")
+            if columns is not None:
+                kwargs["usecols"] = columns
+            df = self.csv(member_path, storage_options=member_storage_options, *args, **kwargs)
+        elif file_type == "json":
+            df = self.json(member_path, storage_options=member_storage_options, *args, **kwargs)
+        elif file_type == "parquet":
+            df = self.parquet(member_path, columns=columns, storage_options=member_storage_options, *args, **kwargs)
+        elif file_type == "orc":
+            df = self.orc(member_path, columns=columns, storage_options=member_storage_options, *args, **kwargs)
+        else:
+            RaiseIt.value_error(file_type, ["csv", "tsv", "txt", "json", "parquet", "orc"])
+
+        if n_partitions is not None:
+            df.data = df.data.repartition(npartitions=n_partitions)
+
+        df.meta = Meta.batch_set(df.meta, {"file_name": path, "name": filename})
+
+        return df
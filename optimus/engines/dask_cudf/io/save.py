@@ -1,4 +1,5 @@
-from optimus.engines.base.io.save import BaseSave, DEFAULT_MODE
+from optimus.engines.base.io.save import BaseSave, DEFAULT_MODE, parquet_column_name
+from optimus.engines.dask_cudf.io.gds import gds
 from optimus.helpers.logger import logger
 
 from optimus.helpers.types import *
@@ -36,24 +37,27 @@ class Save(BaseSave):
             logger.print(error)
             raise
 
-    def parquet(self, path, mode=DEFAULT_MODE, num_partitions=1, compression="snappy", *args, **kwargs):
-
-        # This character are invalid as column names by parquet
-        invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-        def func(col_name):
-            for i in invalid_character:
-                col_name = col_name.replace(i, "_")
-            return col_name
-
-        df = self.root.cols.rename(func)
-
-        try:
-            df.to_parquet(path, compression=compression)
-            print(path)
-        except IOError as e:
-            logger.print(e)
-            raise
+    def parquet(self, path, mode=DEFAULT_MODE, num_partitions=1, compression="snappy", use_gds=True, *args,
+                **kwargs):
+        """
+        Save data frame to a parquet file using the cuDF writer, so the data does not leave the GPU until it is
+        written.
+        :param path: path where the dataframe will be saved.
+        :param mode:
+        :param num_partitions:
+        :param compression: Compression codec.
+        :param use_gds: Write the files through KvikIO, using GPUDirect Storage when it is available.
+        :return:
+        """
+
+        df = self.root.cols.rename(parquet_column_name)
+
+        with gds(use_gds):
+            try:
+                df.data.to_parquet(path, write_index=False, compression=compression, *args, **kwargs)
+            except IOError as e:
+                logger.print(e)
+                raise
 
     def avro(self, path, *args, **kwargs):
         raise NotImplementedError('Not implemented yet')
@@ -154,8 +154,12 @@ class Cols(DataFrameBaseColumns):
             # Categorical columns can not handle a list inside a list as return for example [[1,2],[6,7]].
             # That could happened if we try to split a categorical column
             # df[col_name] = df[col_name].astype("object")
-            df[col_name + "__match_positions__"] = df[col_name].astype("object").apply(get_match_positions,
-                                                                                       args=(sub,))
+            positions = df[col_name].astype("object").apply(get_match_positions, args=(sub,))
+            # Same output as the other engines, the start and the end of every match in separate columns
+            df[col_name + "__match_starts__"] = positions.apply(
+                lambda _positions: None if _positions is None else [start for start, end in _positions])
+            df[col_name + "__match_ends__"] = positions.apply(
+                lambda _positions: None if _positions is None else [end for start, end in _positions])
         return df
 
     @staticmethod
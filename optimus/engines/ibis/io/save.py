@@ -2,7 +2,7 @@ import pandas as pd
 
 DataFrame = pd.DataFrame
 from optimus.helpers.logger import logger
-from optimus.engines.base.io.save import BaseSave
+from optimus.engines.base.io.save import BaseSave, parquet_column_name
 
 
 def save(self: DataFrame):
@@ -38,15 +38,7 @@ def save(self: DataFrame):
         @staticmethod
         def parquet(path, mode="overwrite", num_partitions=1):
 
-            # This character are invalid as column names by parquet
-            invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-            def func(col_name):
-                for i in invalid_character:
-                    col_name = col_name.replace(i, "_")
-                return col_name
-
-            df = self.cols.rename(func)
+            df = self.cols.rename(parquet_column_name)
 
             try:
                 df.to_parquet(path, num_partitions=num_partitions)
@@ -2,7 +2,7 @@ import os
 
 import pandavro as pdx
 
-from optimus.engines.base.io.save import BaseSave
+from optimus.engines.base.io.save import BaseSave, parquet_column_name
 from optimus.helpers.logger import logger
 
 from optimus.helpers.types import *
@@ -64,15 +64,7 @@ class Save(BaseSave):
         :return:
         """
 
-        # This character are invalid as column names by parquet
-        invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-        def func(col_name):
-            for i in invalid_character:
-                col_name = col_name.replace(i, "_")
-            return col_name
-
-        df = self.root.cols.rename(func=func)
+        df = self.root.cols.rename(func=parquet_column_name)
 
         try:
             df.data.to_parquet(path)
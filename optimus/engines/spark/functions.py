@@ -229,8 +229,8 @@ class SparkFunctions(PandasBaseFunctions, DataFrameBaseFunctions):
     def df_concat(df_list):
         return ks.concat(df_list, axis=0, ignore_index=True)
 
-    def word_tokenize(self, series):
-        return self.to_string(series).map(word_tokenize, na_action=None)
+    def word_tokenize(self, series, engine="nltk"):
+        return word_tokenize(self.to_string(series), engine)
 
     def count_zeros(self, series, *args):
         return int((self.to_float(series).values == 0).sum())
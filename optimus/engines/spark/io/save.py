@@ -1,10 +1,25 @@
-from optimus.engines.spark.spark import Spark
-from optimus.helpers.columns import parse_columns
+from pyspark.sql import functions as F
+from pyspark.sql.types import ArrayType, BinaryType, DateType, MapType, NullType, StructType, \
+    UserDefinedType
+
 from optimus.helpers.functions import path_is_local, prepare_path_local
 from optimus.helpers.logger import logger
 
 from optimus.helpers.types import *
-from optimus.engines.base.io.save import BaseSave
+from optimus.engines.base.io.save import BaseSave, parquet_column_name
+
+
+def _set_partitions(df, num_partitions):
+    """
+    Coalesce when reducing the number of partitions, so no shuffle is needed, and repartition when increasing it,
+    because coalesce can not add partitions.
+    :param df: Spark dataframe
+    :param num_partitions: Number of partitions to write
+    :return:
+    """
+    if num_partitions <= df.rdd.getNumPartitions():
+        return df.coalesce(num_partitions)
+    return df.repartition(num_partitions)
 
 
 class Save(BaseSave):
@@ -16,10 +31,10 @@ class Save(BaseSave):
 
         df = self.root.data
         try:
-            # na.fill enforce null value keys to the json output
-            df.na.fill("") \
-                .repartition(num_partitions) \
+            # ignoreNullFields enforce null value keys to the json output
+            df.repartition(num_partitions) \
                 .write \
+                .option("ignoreNullFields", "false") \
                 .option("encoding", encoding) \
                 .format("json") \
                 .mode(mode) \
@@ -45,19 +60,29 @@ class Save(BaseSave):
                 logger.print(error)
                 raise
 
-            columns = parse_columns(df, "*",
-                                    filter_by_column_types=["date", "array", "vector", "binary", "null"])
-            df = df.cols.cast(columns, "str").repartition(num_partitions)
+            # Stringify the types the csv writer can not handle in the same projection
+            exprs = []
+            for field in df.data.schema.fields:
+                expr = F.col(f"`{field.name}`")
+                if isinstance(field.dataType, (ArrayType, MapType, StructType)):
+                    expr = F.to_json(expr)
+                elif isinstance(field.dataType, DateType):
+                    expr = F.date_format(expr, "yyyy-MM-dd")
+                elif isinstance(field.dataType, (BinaryType, NullType, UserDefinedType)):
+                    expr = expr.cast("string")
+                exprs.append(expr.alias(field.name))
+
+            df = df.data.select(*exprs).repartition(num_partitions)
 
             # Save to csv
             if single_file is True:
                 print(path)
-                # df.data.repartition(1).write.csv(path)
-                df.data.toPandas().to_csv(path, header=True)
-                # df.data.repartition(1).write.format('com.databricks.spark.csv').save(path,
+                # df.repartition(1).write.csv(path)
+                df.toPandas().to_csv(path, header=True)
+                # df.repartition(1).write.format('com.databricks.spark.csv').save(path,
                 #                                                                 header='true')
             else:
-                df.data.write.options(header=header).mode(mode).csv(path, sep=sep)
+                df.write.options(header=header, emptyValue="").mode(mode).csv(path, sep=sep)
 
             # val conf    = sc.hadoopConfiguration
             # val src     = new Path(tmpFolder)
@@ -82,23 +107,20 @@ class Save(BaseSave):
         :param num_partitions: the number of partitions of the DataFrame
         :return:
         """
-        # This character are invalid as column names by parquet
-        invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-        df = self.root
-
-        def func(col_name):
-            for i in invalid_character:
-                col_name = col_name.replace(i, "_")
-            return col_name
+        df = self.root.data
 
-        df = df.cols.rename(func)
+        # Rename and cast null columns to string in a single projection
+        exprs = []
+        for field in df.schema.fields:
+            expr = F.col(f"`{field.name}`")
+            if isinstance(field.dataType, NullType):
+                expr = expr.cast("string")
+            exprs.append(expr.alias(parquet_column_name(field.name)))
 
-        columns = parse_columns(df, "*", filter_by_column_types=["null"])
-        df = df.cols.cast(columns, "str")
+        df = df.select(*exprs)
 
         try:
-            df.coalesce(num_partitions) \
+            _set_partitions(df, num_partitions) \
                 .write \
                 .mode(mode) \
                 .parquet(path)
@@ -108,10 +130,10 @@ class Save(BaseSave):
 
     def avro(self, path, mode="overwrite", num_partitions=1):
 
-        df = self.root
+        df = self.root.data
         try:
             avro_version = "avro"
-            df.coalesce(num_partitions) \
+            _set_partitions(df, num_partitions) \
                 .write.format(avro_version) \
                 .mode(mode) \
                 .save(path)
@@ -4,7 +4,7 @@ from optimus.helpers.functions import prepare_path_local, path_is_local
 from optimus.helpers.logger import logger
 
 from optimus.helpers.types import *
-from optimus.engines.base.io.save import BaseSave
+from optimus.engines.base.io.save import BaseSave, parquet_column_name
 
 
 class Save(BaseSave):
@@ -64,15 +64,7 @@ class Save(BaseSave):
     def parquet(self, path, mode="overwrite", num_partitions=1, engine="pyarrow", storage_options=None, conn=None,
                 **kwargs):
 
-        # This character are invalid as column names by parquet
-        invalid_character = [" ", ",", ";", "{", "}", "(", ")", "\n", "\t", "="]
-
-        def func(col_name):
-            for i in invalid_character:
-                col_name = col_name.replace(i, "_")
-            return col_name
-
-        df = self.root.cols.rename(func=func)
+        df = self.root.cols.rename(func=parquet_column_name)
 
         if conn is not None:
             path = conn.path(path)
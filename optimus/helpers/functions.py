@@ -8,6 +8,7 @@ import re
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 from typing import Union
 from urllib.parse import unquote
@@ -444,15 +445,21 @@ def unquote_path(path):
     return unquote(path)
 
 
-@functools.lru_cache(maxsize=128)
 def prepare_path(path, file_format=None):
-    """d
+    """
     Helper to return the file to be loaded and the file name.
-    This will memoise
+    Results are memoised. Set the OPTIMUS_PATH_CACHE_TTL environment variable to the number of seconds a result
+    can be reused, or call prepare_path.cache_clear() to invalidate them.
     :param path: Path to the file to be loaded
     :param file_format: format file
     :return:
     """
+    ttl = float(os.environ.get("OPTIMUS_PATH_CACHE_TTL", 0))
+    return _prepare_path(path, file_format, int(time.time() // ttl) if ttl > 0 else 0)
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_path(path, file_format, ttl_bucket):
     r = []
     if is_url(path):
         file = downloader(path, file_format)
@@ -466,6 +473,9 @@ def prepare_path(path, file_format=None):
     return r
 
 
+prepare_path.cache_clear = _prepare_path.cache_clear
+
+
 def prepare_path_local(path):
     """
     Helper create the folder of the file to be saved
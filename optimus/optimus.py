@@ -38,6 +38,14 @@ class EnginePretty(Enum):
 
 
 def engine_function(engine, func, *args, **kwargs):
+    """
+    Call the function registered for an engine.
+    :param engine: A string identifying an engine :class:`Engine`.
+    :param func: Dict mapping every engine to the function that starts it.
+    :param args: Positional arguments passed to the function of the selected engine only.
+    :param kwargs: Keyword arguments passed to the function of the selected engine only.
+    :return: The value returned by the function.
+    """
     if engine in Engine.list():
         return func[engine](*args, **kwargs)
     else:
@@ -99,8 +107,9 @@ def optimus(engine=Engine.DASK.value, *args, **kwargs):
     """
     This is the entry point to initialize the selected engine.
     :param engine: A string identifying an engine :classL`Engine`.
-    :param args:
-    :param kwargs:
+    :param args: Positional arguments of the engine constructor, for example session or address for dask.
+    :param kwargs: Keyword arguments of the engine constructor, for example n_workers for dask or rmm_pool_size for
+    dask_cudf.
     :return:
     """
     logger.print("ENGINE", engine)
@@ -126,7 +135,7 @@ def optimus(engine=Engine.DASK.value, *args, **kwargs):
 
              }
 
-    op = engine_function(engine, funcs)
+    op = engine_function(engine, funcs, *args, **kwargs)
 
     # Set cupy yo user RMM
     def switch_to_rmm_allocator():
@@ -0,0 +1,78 @@
+import datetime
+import numpy as np
+from optimus.tests.base import TestBase
+
+
+def Timestamp(t):
+    return datetime.datetime.strptime(t, "%Y-%m-%d %H:%M:%S")
+
+
+NaT = np.datetime64('NaT')
+nan = float("nan")
+inf = float("inf")
+
+
+class TestDatetimePandas(TestBase):
+    config = {'engine': 'pandas'}
+    dict = {('iso_date', 'object'): [None, '2021-01-05', '2020-12-31', None, '2021-01-05'], ('iso_datetime', 'object'): ['2021-01-05 10:30:00', None, '2020-12-31 23:59:59', '2021-01-05 10:30:00', None]}
+    maxDiff = None
+
+    def test_cols_to_datetime_iso_date(self):
+        df = self.df.copy()
+        result = df.cols.to_datetime(cols='iso_date')
+        values = result.cols.select('iso_date').to_dict(n='all', orient='list')['iso_date']
+        self.assertEqual(sorted(str(value)[:10] for value in values if value is not None and value == value), ['2020-12-31', '2021-01-05', '2021-01-05'])
+
+    def test_cols_to_datetime_iso_datetime(self):
+        df = self.df.copy()
+        result = df.cols.to_datetime(cols='iso_datetime')
+        values = result.cols.select('iso_datetime').to_dict(n='all', orient='list')['iso_datetime']
+        self.assertEqual(sorted(str(value)[:19] for value in values if value is not None and value == value), ['2020-12-31 23:59:59', '2021-01-05 10:30:00', '2021-01-05 10:30:00'])
+
+
+    def test_cols_format_date(self):
+        df = self.create_dataframe(data={('date', 'object'): ['2021/01/05', None, '2020/12/31', 'bad', '2021/01/05']}, force_data_types=True)
+        result = df.cols.format_date(cols='date', current_format='%Y/%m/%d', output_format='%d-%m-%Y')
+        values = result.cols.select('date').to_dict(n='all', orient='list')['date']
+        self.assertEqual([value if isinstance(value, str) else None for value in values], ['05-01-2021', None, '31-12-2020', None, '05-01-2021'])
+
+    def test_cols_format_date_output_cols(self):
+        df = self.create_dataframe(data={('date', 'object'): ['2021/01/05', None, '2020/12/31', 'bad', '2021/01/05']}, force_data_types=True)
+        result = df.cols.format_date(cols='date', current_format='%Y/%m/%d', output_format='%b %d, %Y', output_cols='formatted')
+        values = result.to_dict(n='all', orient='list')
+        self.assertEqual(values['date'], ['2021/01/05', None, '2020/12/31', 'bad', '2021/01/05'])
+        self.assertEqual([value if isinstance(value, str) else None for value in values['formatted']], ['Jan 05, 2021', None, 'Dec 31, 2020', None, 'Jan 05, 2021'])
+
+class TestDatetimeDask(TestDatetimePandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestDatetimePartitionDask(TestDatetimePandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
+
+
+try:
+    import cudf # pyright: reportMissingImports=false
+except:
+    pass
+else:
+    class TestDatetimeCUDF(TestDatetimePandas):
+        config = {'engine': 'cudf'}
+
+
+try:
+    import dask_cudf # pyright: reportMissingImports=false
+except:
+    pass
+else:
+    class TestDatetimeDC(TestDatetimePandas):
+        config = {'engine': 'dask_cudf', 'n_partitions': 1}
+
+
+try:
+    import dask_cudf # pyright: reportMissingImports=false
+except:
+    pass
+else:
+    class TestDatetimePartitionDC(TestDatetimePandas):
+        config = {'engine': 'dask_cudf', 'n_partitions': 2}
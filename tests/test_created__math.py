@@ -230,6 +230,12 @@ class TestMathPandas(TestBase):
         self.assertTrue(result.equals(expected, decimal=True, assertion=True))
 
 
+    def test_cols_to_float_out_of_float32_range(self):
+        df = self.create_dataframe(data={('big', 'float64'): [1e300, -2.5, nan], ('id', 'int64'): [16777217, 1, 2]}, force_data_types=True)
+        result = df.cols.to_float(cols=['big', 'id'])
+        self.assertEqual(result.cols.select('big').to_dict(n='all', orient='list')['big'][:2], [1e300, -2.5])
+        self.assertEqual(result.cols.select('id').to_dict(n='all', orient='list'), {'id': [16777217.0, 1.0, 2.0]})
+
 class TestMathDask(TestMathPandas):
     config = {'engine': 'dask', 'n_partitions': 1}
 
@@ -103,6 +103,42 @@ class TestMoreStatisticsPandas(TestBase):
         expected = {'id': 10, 'code': 9, 'discount': 4}
         self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
 
+    def test_cols_count_uniques_missing(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, None, 3.5, 1.5]}, force_data_types=True)
+        result = df.cols.count_uniques(cols='vf', estimate=True)
+        expected = 3
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_impute_mean(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, 4.0, None, 2.5]}, force_data_types=True)
+        result = df.cols.impute(cols='vf', strategy='mean').to_dict(n='all', orient='list')
+        expected = {'vf': [1.5, 2.625, 2.5, 4.0, 2.625, 2.5]}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_impute_median(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, 4.0, None, 2.5]}, force_data_types=True)
+        result = df.cols.impute(cols='vf', strategy='median').to_dict(n='all', orient='list')
+        expected = {'vf': [1.5, 2.5, 2.5, 4.0, 2.5, 2.5]}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_impute_most_frequent_tie(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [2.0, 1.0, None, 2.0, 1.0, None]}, force_data_types=True)
+        result = df.cols.impute(cols='vf', strategy='most_frequent').to_dict(n='all', orient='list')
+        expected = {'vf': [2.0, 1.0, 1.0, 2.0, 1.0, 1.0]}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_impute_string(self):
+        df = self.create_dataframe(data={('vs', 'object'): ['b', None, 'a', 'b', 'a', None]}, force_data_types=True)
+        result = df.cols.impute(cols='vs', output_cols='vs_mf').cols.impute(cols='vs', strategy='constant').to_dict(n='all', orient='list')
+        expected = {'vs': ['b', 'missing_value', 'a', 'b', 'a', 'missing_value'], 'vs_mf': ['b', 'a', 'a', 'b', 'a', 'a']}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_impute_multiple(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, 4.0, None, 2.5], ('vi', 'float64'): [None, 3.0, None, 1.0, 2.0, None]}, force_data_types=True)
+        result = df.cols.impute(cols=['vf', 'vi'], strategy=['median', 'constant'], fill_value=[None, 7]).to_dict(n='all', orient='list')
+        expected = {'vf': [1.5, 2.5, 2.5, 4.0, 2.5, 2.5], 'vi': [7.0, 3.0, 7.0, 1.0, 2.0, 7.0]}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
     def test_cols_count_uniques_numeric(self):
         df = self.df.copy()
         result = df.cols.count_uniques(cols='price', estimate=True)
@@ -133,6 +169,12 @@ class TestMoreStatisticsPandas(TestBase):
         expected = {'frequency': {'vf': {'values': [{'value': 9.9, 'count': 4}, {'value': 3.3000000000000003, 'count': 3}, {'value': 0.0, 'count': 2}, {'value': 1.1, 'count': 2}, {'value': 22.0, 'count': 2}, {'value': 4.4, 'count': 1}], 'count_uniques': 6}, 'vs': {'values': [{'value': 'STR9', 'count': 4}, {'value': 'STR3', 'count': 3}, {'value': 'STR0', 'count': 2}, {'value': 'STR1', 'count': 2}, {'value': 'STR20', 'count': 2}, {'value': 'STR4', 'count': 1}], 'count_uniques': 6}, 'values': {'values': [{'value': 9, 'count': 4}, {'value': 3, 'count': 3}, {'value': 0, 'count': 2}, {'value': 1, 'count': 2}, {'value': 20, 'count': 2}, {'value': 4, 'count': 1}], 'count_uniques': 6}, 'o': {'values': [{'value': 1, 'count': 5}, {'value': 3, 'count': 3}, {'value': 9, 'count': 1}, {'value': [9], 'count': 1}, {'value': 'nine', 'count': 1}, {'value': {'nine': 9}, 'count': 1}], 'count_uniques': 6}}}
         self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
 
+    def test_cols_frequency_missing(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, 1.5, None, 1.5, 3.5, None, 1.5, 2.5]}, force_data_types=True)
+        result = df.cols.frequency(cols='vf', n=1, count_uniques=True)
+        expected = {'frequency': {'vf': {'values': [{'value': 1.5, 'count': 4}], 'count_uniques': 4}}}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
     def test_cols_frequency_multiple(self):
         df = self.create_dataframe(data={('vf', 'float64'): [9.9, 9.9, 9.9, 9.9, 3.3000000000000003, 3.3000000000000003, 3.3000000000000003, 22.0, 22.0, 1.1, 1.1, 0.0, 0.0, 4.4], ('vs', 'object'): ['STR9', 'STR9', 'STR9', 'STR9', 'STR3', 'STR3', 'STR3', 'STR20', 'STR20', 'STR1', 'STR1', 'STR0', 'STR0', 'STR4'], ('values', 'int64'): [9, 9, 9, 9, 3, 3, 3, 20, 20, 1, 1, 0, 0, 4], ('o', 'object'): ['nine', [9], {'nine': 9}, 9, 3, 3, 3, None, None, 1, 1, 1, 1, 1]}, force_data_types=True)
         result = df.cols.frequency(cols=['vs', 'vf'], n=6, percentage=True)
@@ -181,6 +223,12 @@ class TestMoreStatisticsPandas(TestBase):
         expected = {'hist': {'id': [{'lower': 1.0, 'upper': 5.5, 'count': 5}, {'lower': 5.5, 'upper': 10.0, 'count': 5}], 'price': [{'lower': 30.0, 'upper': 104.995, 'count': 6}, {'lower': 104.995, 'upper': 179.99, 'count': 4}], 'discount': [{'lower': 0.0, 'upper': 0.0, 'count': 6}]}}
         self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
 
+    def test_cols_hist_missing(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.0, None, 2.0, 4.0, 7.0, None, 10.0], ('vs', 'object'): ['1', 'a', '10', None, '4', '4', '7']}, force_data_types=True)
+        result = df.cols.hist(cols=['vf', 'vs'], buckets=3, range=(0, 12))
+        expected = {'hist': {'vf': [{'lower': 0.0, 'upper': 4.0, 'count': 2}, {'lower': 4.0, 'upper': 8.0, 'count': 2}, {'lower': 8.0, 'upper': 12.0, 'count': 1}], 'vs': [{'lower': 0.0, 'upper': 4.0, 'count': 1}, {'lower': 4.0, 'upper': 8.0, 'count': 3}, {'lower': 8.0, 'upper': 12.0, 'count': 1}]}}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
     def test_cols_hist_multiple(self):
         df = self.df.copy()
         result = df.cols.hist(cols=['id', 'code', 'discount'], buckets=4)
@@ -241,6 +289,18 @@ class TestMoreStatisticsPandas(TestBase):
         expected = {'id': {'match': 10, 'missing': 0, 'mismatch': 0, 'inferred_data_type': 'int'}, 'code': {'match': 10, 'missing': 0, 'mismatch': 0, 'inferred_data_type': 'str'}, 'discount': {'match': 6, 'missing': 0, 'mismatch': 4, 'inferred_data_type': 'int'}}
         self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
 
+    def test_cols_quality_multiple_missing(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, None, 3.5, 4.5], ('vs', 'object'): ['a', 'b', None, 'c', 'd', '1'], ('vi', 'int64'): [1, 2, 3, 4, 5, 6]}, force_data_types=True)
+        result = df.cols.quality(cols={'vf': 'float', 'vs': 'int', 'vi': 'int'}, flush=True)
+        expected = {'vf': {'match': 6, 'missing': 2, 'mismatch': 0, 'inferred_data_type': 'float'}, 'vs': {'match': 1, 'missing': 1, 'mismatch': 4, 'inferred_data_type': 'int'}, 'vi': {'match': 6, 'missing': 0, 'mismatch': 0, 'inferred_data_type': 'int'}}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
+    def test_cols_quality_missing(self):
+        df = self.create_dataframe(data={('vf', 'float64'): [1.5, None, 2.5, None, 3.5, 4.5]}, force_data_types=True)
+        result = df.cols.quality(cols={'vf': 'float'}, flush=True)
+        expected = {'vf': {'match': 6, 'missing': 2, 'mismatch': 0, 'inferred_data_type': 'float'}}
+        self.assertTrue(results_equal(result, expected, decimal=5, assertion=True))
+
     def test_cols_quality_numeric(self):
         df = self.df.copy()
         result = df.cols.quality(cols='price', flush=True)
@@ -571,6 +571,12 @@ class TestNumericPandas(TestBase):
         expected = self.create_dataframe(data={('height(ft)', 'int32'): [-28, 17, 26, 13, 0, 300]}, force_data_types=True)
         self.assertTrue(result.equals(expected, decimal=True, assertion=True))
 
+    def test_cols_to_integer_out_of_range(self):
+        df = self.create_dataframe(data={('to_integer_test', 'float64'): [1e19, -2.5, nan, 7.9, -1e19, 9.2e18]}, force_data_types=True)
+        result = df.cols.to_integer(cols=['to_integer_test'])
+        expected = self.create_dataframe(data={('to_integer_test', 'int64'): [0, -2, 0, 7, 0, 9200000000000000000]}, force_data_types=True)
+        self.assertTrue(result.equals(expected, decimal=True, assertion=True))
+
     def test_cols_to_integer_string(self):
         df = self.df.copy().cols.select(['names'])
         result = df.cols.to_integer(cols=['names'], output_cols=['names_2'])
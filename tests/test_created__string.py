@@ -493,6 +493,12 @@ class TestStringPandas(TestBase):
         expected = self.create_dataframe(data={('height(ft)', 'object'): [['-28.0'], ['17.0'], ['26.0'], ['13.0'], ['nan'], ['300.0']]}, force_data_types=True)
         self.assertTrue(result.equals(expected, decimal=True, assertion=True))
 
+    def test_cols_word_tokenize_regex(self):
+        df = self.create_dataframe(data={('word_tokenize_test', 'object'): ['THis iS a TEST', 'bumbl#ebéé  ', "don't stop", '      ', '12.5']}, force_data_types=True)
+        result = df.cols.word_tokenize(cols=['word_tokenize_test'], engine='regex')
+        expected = {'word_tokenize_test': [['THis', 'iS', 'a', 'TEST'], ['bumbl', 'ebéé'], ['don', 't', 'stop'], [], ['12', '5']]}
+        self.assertEqual({col: [list(value) for value in values] for col, values in result.to_dict(n='all', orient='list').items()}, expected)
+
     def test_cols_word_tokenize_string(self):
         df = self.df.copy().cols.select(['names'])
         result = df.cols.word_tokenize(cols=['names'], output_cols=['names_2'])
@@ -551,3 +557,89 @@ except:
 else:
     class TestStringVaex(TestStringPandas):
         config = {'engine': 'vaex'}
+
+
+def match_positions(df, col):
+    starts = df.data[col + "__match_starts__"].tolist()
+    ends = df.data[col + "__match_ends__"].tolist()
+    return [[[int(start), int(end)] for start, end in zip(_starts, _ends)] if np.ndim(_starts) else None
+            for _starts, _ends in zip(starts, ends)]
+
+
+class TestFindPandas(TestBase):
+    config = {'engine': 'pandas'}
+    dict = {('find_test', 'object'): ['banana', 'Bánana ANA', None, 'cañon and Canon', 'xyz', 'ÑaNa ana']}
+    maxDiff = None
+
+    def test_cols_find_literal(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub='an')
+        expected = [[[1, 3], [3, 5]], [[3, 5]], None, [[6, 8], [11, 13]], None, [[5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_literal_ignore_case(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub='an', ignore_case=True)
+        expected = [[[1, 3], [3, 5]], [[3, 5], [7, 9]], None, [[6, 8], [11, 13]], None, [[1, 3], [5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_few_literals_ignore_case(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['a', 'n'], ignore_case=True)
+        expected = [[[1, 2], [2, 3], [3, 4], [4, 5], [5, 6]], [[2, 3], [3, 4], [4, 5], [5, 6], [7, 8], [8, 9], [9, 10]], None, [[1, 2], [4, 5], [6, 7], [7, 8], [11, 12], [12, 13], [14, 15]], None, [[1, 2], [2, 3], [3, 4], [5, 6], [6, 7], [7, 8]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_few_literals_non_ascii(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['añ', 'an'])
+        expected = [[[1, 3], [3, 5]], [[3, 5]], None, [[1, 3], [6, 8], [11, 13]], None, [[5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_many_literals(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['an', 'na', 'b', 'x'])
+        expected = [[[0, 1], [1, 3], [3, 5]], [[2, 4], [4, 6]], None, [[6, 8], [11, 13]], [[0, 1]], [[5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_many_literals_ignore_case(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['an', 'na', 'b', 'x'], ignore_case=True)
+        expected = [[[0, 1], [1, 3], [3, 5]], [[0, 1], [2, 4], [4, 6], [7, 9]], None, [[6, 8], [11, 13]], [[0, 1]], [[1, 3], [5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_many_literals_non_ascii(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['añ', 'ñ', 'on', 'an'])
+        expected = [[[1, 3], [3, 5]], [[3, 5]], None, [[1, 3], [3, 5], [6, 8], [11, 13], [13, 15]], None, [[5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+    def test_cols_find_many_literals_non_ascii_ignore_case(self):
+        df = self.df.copy()
+        result = df.cols.find(cols='find_test', sub=['Añ', 'ñ', 'on', 'an'], ignore_case=True)
+        expected = [[[1, 3], [3, 5]], [[3, 5], [7, 9]], None, [[1, 3], [3, 5], [6, 8], [11, 13], [13, 15]], None, [[0, 1], [1, 3], [5, 7]]]
+        self.assertEqual(match_positions(result, 'find_test'), expected)
+
+
+try:
+    import cudf # pyright: reportMissingImports=false
+except:
+    pass
+else:
+    class TestFindCUDF(TestFindPandas):
+        config = {'engine': 'cudf'}
+
+
+class TestStringToIndexPandas(TestBase):
+    config = {'engine': 'pandas'}
+    maxDiff = None
+
+    def test_cols_string_to_index_categorical(self):
+        import pandas as pd
+        values = ['pear', 'apple', 'fig', 'apple', 'pear']
+        data = pd.DataFrame({'c': pd.Categorical(values, categories=['pear', 'kiwi', 'fig', 'apple']), 'o': values})
+        df = self.op.create.dataframe(data)
+        result = df.cols.string_to_index(cols=['c', 'o'], output_cols=['c_i', 'o_i'])
+        self.assertEqual(result.cols.select(['c_i', 'o_i']).to_dict(n='all', orient='list'), {'c_i': [2, 0, 1, 0, 2], 'o_i': [2, 0, 1, 0, 2]})
+        self.assertEqual(list(result.le.classes_), ['apple', 'fig', 'pear'])
+        result = result.cols.index_to_string(cols='c_i', output_cols='c_s')
+        self.assertEqual(result.cols.select('c_s').to_dict(n='all', orient='list'), {'c_s': values})
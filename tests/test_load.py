@@ -1,3 +1,7 @@
+import os
+
+import pandas as pd
+
 from optimus.tests.base import TestBase
 
 
@@ -164,6 +168,50 @@ else:
         config = {'engine': 'dask_cudf', 'n_partitions': 2}
 
 
+    class TestLoadFormatsDC(TestBase):
+        config = {'engine': 'dask_cudf'}
+
+        def setUp(self):
+            import tempfile
+            self.tmp_dir = tempfile.TemporaryDirectory()
+            self.pdf = pd.read_csv("examples/data/foo.csv")
+
+        def tearDown(self):
+            self.tmp_dir.cleanup()
+
+        def test_orc_n_partitions(self):
+            path = os.path.join(self.tmp_dir.name, "foo.orc")
+            self.pdf.to_orc(path)
+            df = self.load_dataframe(path, type="orc", n_partitions=3)
+            self.assertEqual(df.rows.count(), 19)
+            self.assertEqual(df.partitions(), 3)
+
+        def test_hdf5_n_partitions(self):
+            path = os.path.join(self.tmp_dir.name, "foo.h5")
+            self.pdf.to_hdf(path, key="foo", format="table")
+            df = self.load_dataframe(path, type="hdf5", n_partitions=3)
+            self.assertEqual(df.rows.count(), 19)
+            self.assertEqual(df.partitions(), 3)
+
+        def test_xls_partitions(self):
+            df = self.load_dataframe("examples/data/titanic3.xls", type="excel")
+            self.assertEqual(df.rows.count(), 1309)
+            self.assertEqual(df.partitions(), 1)
+            df = self.load_dataframe("examples/data/titanic3.xls", type="excel", n_partitions=3)
+            self.assertEqual(df.rows.count(), 1309)
+            self.assertEqual(df.partitions(), 3)
+
+        def test_zip_n_partitions(self):
+            import zipfile
+            path = os.path.join(self.tmp_dir.name, "foo.zip")
+            with zipfile.ZipFile(path, "w") as zip_file:
+                zip_file.write("examples/data/foo.csv", "foo.csv")
+            df = self.load_dataframe(path, type="zip", filename="foo.csv", n_partitions=3)
+            self.assertEqual(df.rows.count(), 19)
+            self.assertEqual(df.cols.names(), list(self.pdf.columns))
+            self.assertEqual(df.partitions(), 3)
+
+
 try:
     import pyspark
 except:
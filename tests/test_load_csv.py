@@ -43,6 +43,11 @@ else:
     class TestCSVDC(TestCSVPandas):
         config = {'engine': 'dask_cudf'}
 
+        def test_csv_without_gds(self):
+            df = self.load_dataframe("examples/data/foo.csv", use_gds=False)
+            self.assertEqual(df.rows.count(), 19)
+            self.assertEqual(df.cols.names(), ["id", "firstName", "lastName", "billingId", "product", "price", "birth", "dummyCol"])
+
 
 try:
     import dask_cudf # pyright: reportMissingImports=false
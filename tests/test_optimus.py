@@ -0,0 +1,26 @@
+import unittest
+
+from optimus import Optimus
+
+
+class TestOptimusArguments(unittest.TestCase):
+
+    def test_pandas_arguments(self):
+        op = Optimus("pandas", verbose=False)
+        self.assertEqual(op.engine, "pandas")
+        self.assertEqual(op.create.dataframe({"A": [1, 2]}).rows.count(), 2)
+
+    def test_pandas_positional_arguments(self):
+        op = Optimus("pandas", False)
+        self.assertEqual(op.engine, "pandas")
+
+    def test_dask_arguments(self):
+        op = Optimus("dask", n_workers=1, threads_per_worker=2, processes=False)
+        try:
+            self.assertEqual(op.engine, "dask")
+            workers = op.client.scheduler_info()["workers"]
+            self.assertEqual(len(workers), 1)
+            self.assertEqual([worker["nthreads"] for worker in workers.values()], [2])
+            self.assertEqual(op.create.dataframe({"A": [1, 2]}).rows.count(), 2)
+        finally:
+            op.client.close()
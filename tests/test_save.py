@@ -0,0 +1,67 @@
+import glob
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from optimus.tests.base import TestBase
+
+
+try:
+    import pyspark # pyright: reportMissingImports=false
+except:
+    pass
+else:
+    class TestSaveSpark(TestBase):
+        config = {'engine': 'spark'}
+
+        def setUp(self):
+            self.tmp_dir = tempfile.TemporaryDirectory()
+
+        def tearDown(self):
+            self.tmp_dir.cleanup()
+
+        def spark_dataframe(self, null_column=False):
+            from pyspark.sql.types import ArrayType, LongType, NullType, StringType, StructField, StructType
+            from optimus.engines.spark.dataframe import SparkDataFrame
+
+            fields = [StructField("id", LongType()), StructField("first name", StringType()),
+                      StructField("tags", ArrayType(StringType()))]
+            rows = [(1, "Optimus", ["a", "b"]), (2, None, []), (3, "Jazz", None)]
+            if null_column:
+                fields.append(StructField("empty", NullType()))
+                rows = [row + (None,) for row in rows]
+
+            data = self.op.spark.createDataFrame(rows, StructType(fields)).coalesce(1)
+            return SparkDataFrame(data, op=self.op)
+
+        def test_parquet(self):
+            path = os.path.join(self.tmp_dir.name, "foo.parquet")
+            self.spark_dataframe(null_column=True).save.parquet(path, num_partitions=2)
+            self.assertEqual(len(glob.glob(os.path.join(path, "part-*.parquet"))), 2)
+            result = pd.read_parquet(path).sort_values("id")
+            self.assertEqual(list(result.columns), ["id", "first_name", "tags", "empty"])
+            self.assertEqual(result["first_name"].tolist(), ["Optimus", None, "Jazz"])
+            self.assertTrue(result["empty"].isnull().all())
+
+        def test_json_null_fields(self):
+            path = os.path.join(self.tmp_dir.name, "foo.json")
+            self.spark_dataframe().save.json(path)
+            records = []
+            for file_name in glob.glob(os.path.join(path, "part-*.json")):
+                with open(file_name) as file:
+                    records.extend(json.loads(line) for line in file if line.strip())
+            records = sorted(records, key=lambda record: record["id"])
+            self.assertEqual(records, [{"id": 1, "first name": "Optimus", "tags": ["a", "b"]},
+                                       {"id": 2, "first name": None, "tags": []},
+                                       {"id": 3, "first name": "Jazz", "tags": None}])
+
+        def test_csv_complex_columns(self):
+            path = os.path.join(self.tmp_dir.name, "foo.csv")
+            self.spark_dataframe(null_column=True).save.csv(path, single_file=False)
+            result = pd.concat([pd.read_csv(file_name) for file_name in glob.glob(os.path.join(path, "part-*.csv"))])
+            result = result.sort_values("id")
+            self.assertEqual(list(result.columns), ["id", "first name", "tags", "empty"])
+            self.assertEqual([json.loads(value) if isinstance(value, str) else None for value in result["tags"]],
+                             [["a", "b"], [], None])